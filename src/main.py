@@ -3,6 +3,8 @@ from __future__ import annotations
 import asyncio
 import os
 import random
+import statistics
+import threading
 from typing import Any
 
 from dotenv import load_dotenv
@@ -12,9 +14,9 @@ from pydantic_ai.models.openai import OpenAIChatModel, OpenAIResponsesModel
 from pydantic_ai.providers.openai import OpenAIProvider
 from pydantic_ai.settings import ModelSettings
 
-import src.switchboard_mcp.utils as utils
 from simple_script.interpreter import Interpreter
 from simple_script.tools import Tool
+from switchboard_mcp import utils
 from switchboard_mcp.utils import Folder
 
 load_dotenv()
@@ -51,6 +53,10 @@ class Services:
             tools = []
         self.root = Folder.from_tools(tools)
         self.tools = tools
+        # One interpreter reused by every script; the lock serializes scripts
+        # because tools may be called in parallel
+        self.interpreter = Interpreter(tools=[*tools, utils.PRINT_TOOL])
+        self.interpreter_lock = threading.Lock()
 
 
 def math_operations_plus(x: float, y: float) -> float:
@@ -117,7 +123,7 @@ def math_statistics_average(numbers: list[float]) -> float:
     Args:
         numbers: List of numbers to calculate the average from
     """
-    return sum(numbers) / len(numbers)
+    return statistics.fmean(numbers)
 
 
 def math_random_generate_list(n: int, start: float, end: float) -> list[float]:
@@ -128,7 +134,10 @@ def math_random_generate_list(n: int, start: float, end: float) -> list[float]:
         start: The minimum value (inclusive)
         end: The maximum value (inclusive)
     """
-    return [random.uniform(start, end) for _ in range(n)]
+    # Same formula as random.uniform, without a Python-level call per value
+    rand = random.random
+    span = end - start
+    return [start + span * rand() for _ in range(n)]
 
 
 math_mcp = [
@@ -184,17 +193,10 @@ def execute_script(ctx: RunContext[Services], script: str) -> str:
 
     print("execute_script -------------------------- START")
     print(script)
-    prints = []
-
-    def builtins_print(*args: Any) -> None:
-        """Print all arguments."""
-        output = " ".join(str(arg) for arg in args)
-        prints.append(output)
-
-    interpreter = Interpreter(
-        tools=[*ctx.deps.tools, Tool.from_function(builtins_print)]
-    )
-    _ = interpreter.evaluate(script)
+    with utils.collect_script_prints() as prints, ctx.deps.interpreter_lock:
+        interpreter = ctx.deps.interpreter
+        interpreter.reset()
+        _ = interpreter.evaluate(script)
     print("execute_script -------------------------- END")
     result = "\n".join(prints)
     print(result)
@@ -219,17 +221,60 @@ You can use these tools to execute the script with execute_script tool.
 )
 
 
+# Limits how many agent runs are in flight at once (provider rate limits)
+MAX_CONCURRENT_REQUESTS = int(os.environ.get("MAX_CONCURRENT_REQUESTS", "4"))
+request_semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+
+# Results of runs without history, keyed by model, normalized question and tools
+RESPONSE_CACHE_SIZE = 1024
+response_cache: dict[tuple[str, str, tuple[str, ...]], Any] = {}
+
+
+def _response_cache_key(question: str, deps: Services) -> tuple[str, str, tuple[str, ...]]:
+    normalized = " ".join(question.split()).lower()
+    return AGENT_MODEL, normalized, tuple(tool.name for tool in deps.tools)
+
+
+async def ask(question: str, deps: Services, history: list[Any] | None = None):
+    """Run the agent on a single question.
+
+    Questions asked without history are answered from the response cache
+    when the same question was already asked with the same tools.
+    """
+    if history:
+        async with request_semaphore:
+            return await agent.run(question, deps=deps, message_history=history)
+
+    key = _response_cache_key(question, deps)
+    if key in response_cache:
+        return response_cache[key]
+
+    async with request_semaphore:
+        result = await agent.run(question, deps=deps)
+
+    if len(response_cache) >= RESPONSE_CACHE_SIZE:
+        # Evict the oldest entry
+        response_cache.pop(next(iter(response_cache)), None)
+    response_cache[key] = result
+    return result
+
+
+async def ask_all(questions: list[str], deps: Services) -> list[Any]:
+    """Run independent questions concurrently, sharing one Services instance."""
+    return await asyncio.gather(*(ask(question, deps) for question in questions))
+
+
 async def main():
+    deps = Services(tools=tools)
+
+    # The second question continues the first conversation, so these run in order
     history = []
-    result = await agent.run("What is 5 plus 3?", deps=Services(tools=tools))
+    result = await ask("What is 5 plus 3?", deps)
     history += result.new_messages()
     print(result.output)
-    result = await agent.run(
-        "What is 5 minus 3?",
-        deps=Services(tools=tools),
-        message_history=history,
-    )
-    history.append(result.new_messages())
+    result = await ask("What is 5 minus 3?", deps, history=history)
+    history += result.new_messages()
     print(result.output)
 
 
@@ -2,6 +2,7 @@ from .lexer import Lexer, Token, TokenType
 from .parser import (
     Parser,
     ASTNode,
+    NodeKind,
     Number,
     String,
     Variable,
@@ -27,6 +28,7 @@ __all__ = [
     # Parser exports
     "Parser",
     "ASTNode",
+    "NodeKind",
     "Number",
     "String",
     "Variable",
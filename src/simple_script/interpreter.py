@@ -1,6 +1,13 @@
-from typing import Any
-
-from src.simple_script.lexer import Lexer
+import operator
+import re
+import threading
+from collections import ChainMap
+from collections.abc import Mapping
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable
+
+from src.simple_script.lexer import KEYWORDS, Lexer
 from src.simple_script.parser import (
     Assignment,
     ASTNode,
@@ -12,6 +19,7 @@ from src.simple_script.parser import (
     IfStatement,
     ImportStatement,
     ListLiteral,
+    NodeKind,
     Number,
     Parser,
     Return,
@@ -21,14 +29,106 @@ from src.simple_script.parser import (
 )
 from src.simple_script.tools import Tool
 
+# A compiled AST node: calling it executes/evaluates the node
+Thunk = Callable[[], Any]
+
+# Binary operators and the C functions implementing them
+_BINOPS: dict[str, Callable[[Any, Any], Any]] = {
+    "+": operator.add,
+    "-": operator.sub,
+    "*": operator.mul,
+    "/": operator.truediv,
+    "==": operator.eq,
+    "<": operator.lt,
+    ">": operator.gt,
+}
+
+# Scripts of the form "from a.b import f, g\nprint(f(<literals>))" are common
+# enough to build their AST directly, without running the lexer and parser
+_IDENT = r"[^\W\d]\w*"
+_LITERAL = r"\d+|\"[^\"\n]*\"|'[^'\n]*'"
+_LITERAL_RE = re.compile(_LITERAL)
+_TRIVIAL_SCRIPT_RE = re.compile(
+    rf"""
+    from[ \t]+(?P<module>{_IDENT}(?:\.{_IDENT})*)
+    [ \t]+import[ \t]+(?P<names>{_IDENT}(?:[ \t]*,[ \t]*{_IDENT})*)[ \t]*\n
+    print\([ \t]*(?P<function>{_IDENT})\(
+    [ \t]*(?P<args>(?:{_LITERAL})(?:[ \t]*,[ \t]*(?:{_LITERAL}))*)?[ \t]*
+    \)[ \t]*\)[ \t\r\n]*
+    """,
+    re.VERBOSE,
+)
+
+# Tool maps built for recently seen tool lists, keyed by tool identity and
+# name. The tools are kept with their maps so that their ids stay unique.
+# Interpreters are created on worker threads, so access goes through the lock,
+# and the maps are shared as read-only views.
+_TOOL_MAPS_CACHE: dict[
+    tuple[tuple[int, str], ...],
+    tuple[tuple[Tool, ...], Mapping[str, Tool], Mapping[str, Tool]],
+] = {}
+_TOOL_MAPS_CACHE_SIZE = 8
+_TOOL_MAPS_LOCK = threading.Lock()
+
+
+@dataclass
+class CompiledFunction:
+    """A user-defined function whose body has already been compiled"""
+    name: str
+    parameters: list[str]
+    body: list[Thunk]
+
 
 class Interpreter:
     def __init__(self, tools: list[Tool]):
         self.tools = tools
-        self.tool_map, self.builtin_map = self._build_tool_maps()
+        self.tool_map, self.builtin_map = self._cached_tool_maps()
         self.env = {}  # Variable environment
         self.functions = {}  # User-defined functions
         self.last_value = None
+        self._rebound: set[str] = set()  # Names (re)bound by the script being compiled
+        self._stmt_compilers = {
+            ImportStatement: self._compile_import,
+            Assignment: self._compile_assignment,
+            IfStatement: self._compile_if,
+            WhileStatement: self._compile_while,
+            FunctionDef: self._compile_function_def,
+            Return: self._compile_return,
+            ExpressionStatement: self._compile_expression_statement,
+        }
+        self._expr_compilers = {
+            Number: self._compile_literal,
+            String: self._compile_literal,
+            Variable: self._compile_variable,
+            BinaryOp: self._compile_binary_op,
+            Call: self._compile_call,
+            ListLiteral: self._compile_list,
+            DictLiteral: self._compile_dict,
+        }
+
+    def reset(self) -> None:
+        """Forget variables, functions and the last value, keeping the tools"""
+        self.env = {}
+        self.functions = {}
+        self.last_value = None
+
+    def _cached_tool_maps(self) -> tuple[Mapping[str, Tool], Mapping[str, Tool]]:
+        """Return read-only tool maps, reusing the maps built for the same tools"""
+        key = tuple((id(tool), tool.name) for tool in self.tools)
+        with _TOOL_MAPS_LOCK:
+            cached = _TOOL_MAPS_CACHE.get(key)
+            if cached is None:
+                if len(_TOOL_MAPS_CACHE) >= _TOOL_MAPS_CACHE_SIZE:
+                    # Evict the oldest entry
+                    _TOOL_MAPS_CACHE.pop(next(iter(_TOOL_MAPS_CACHE)), None)
+                tool_map, builtin_map = self._build_tool_maps()
+                cached = (
+                    tuple(self.tools),
+                    MappingProxyType(tool_map),
+                    MappingProxyType(builtin_map),
+                )
+                _TOOL_MAPS_CACHE[key] = cached
+        return cached[1], cached[2]
 
     def _build_tool_maps(self) -> tuple[dict[str, Tool], dict[str, Tool]]:
         """Build maps for regular tools and builtin tools"""
@@ -42,49 +142,115 @@ class Interpreter:
                 func_name = tool.name[len("builtins_") :]
                 builtin_map[func_name] = tool
             else:
-                # Convert "math_statistics_min" to "math.statistics.min"
-                parts = tool.name.split("_")
-                # The last part is the function name
-                func_name = parts[-1]
-                # The rest is the module path
-                module_path = ".".join(parts[:-1])
-                full_path = f"{module_path}.{func_name}"
+                # Convert "math_statistics_min" to "math.statistics.min":
+                # the last part is the function name, the rest the module path
+                full_path = tool.name.replace("_", ".")
                 tool_map[full_path] = tool
 
         return tool_map, builtin_map
 
     def evaluate(self, script: str) -> Any:
         """Evaluate a script and return the result"""
-        # Parse the script
-        lexer = Lexer(script)
-        tokens = lexer.tokenize()
-        parser = Parser(tokens)
-        ast = parser.parse()
-
-        # Execute all statements
-        for statement in ast:
-            self.last_value = self._execute_statement(statement)
+        # Parse the script, streaming tokens from the lexer into the parser
+        ast = self._parse_trivial(script)
+        if ast is None:
+            ast = Parser(Lexer(script)).parse()
+
+        # Run the leading imports first so that calls to the imported tools
+        # can be resolved while compiling the rest of the script
+        index = 0
+        while index < len(ast) and ast[index].kind == NodeKind.IMPORT:
+            self.last_value = self._execute_import(ast[index])
+            index += 1
+        rest = ast[index:]
+
+        # Compile every remaining statement once, then run the compiled program
+        self._rebound = self._bound_names(rest)
+        try:
+            program = [self._compile_statement(statement) for statement in rest]
+        finally:
+            self._rebound = set()
+        for statement in program:
+            self.last_value = statement()
 
         return self.last_value
 
-    def _execute_statement(self, node: ASTNode) -> Any:
-        """Execute a statement and return its value"""
-        if isinstance(node, ImportStatement):
-            return self._execute_import(node)
-        elif isinstance(node, Assignment):
-            return self._execute_assignment(node)
-        elif isinstance(node, IfStatement):
-            return self._execute_if(node)
-        elif isinstance(node, WhileStatement):
-            return self._execute_while(node)
-        elif isinstance(node, FunctionDef):
-            return self._execute_function_def(node)
-        elif isinstance(node, Return):
-            return self._evaluate_expression(node.value)
-        elif isinstance(node, ExpressionStatement):
-            return self._evaluate_expression(node.expression)
-        else:
-            raise RuntimeError(f"Unknown statement type: {type(node)}")
+    @staticmethod
+    def _parse_trivial(script: str) -> list[ASTNode] | None:
+        """Build the AST of an import followed by print(f(literals)).
+
+        Returns None for any other script, which then goes through the
+        lexer and parser.
+        """
+        match = _TRIVIAL_SCRIPT_RE.fullmatch(script)
+        if match is None:
+            return None
+
+        module_path = match["module"]
+        names = [name.strip() for name in match["names"].split(",")]
+        function = match["function"]
+        identifiers = [*module_path.split("."), *names, function]
+        if any(identifier in KEYWORDS for identifier in identifiers):
+            return None
+
+        arguments = []
+        for literal in _LITERAL_RE.findall(match["args"] or ""):
+            if literal[0] in "\"'":
+                arguments.append(String(literal[1:-1]))
+            else:
+                arguments.append(Number(int(literal)))
+
+        return [
+            ImportStatement(module_path, names=names),
+            ExpressionStatement(Call("print", [Call(function, arguments)])),
+        ]
+
+    def _bound_names(self, statements: list[ASTNode]) -> set[str]:
+        """Collect every name that the given statements can bind at runtime"""
+        names = set()
+        for stmt in statements:
+            kind = stmt.kind
+            if kind == NodeKind.ASSIGNMENT:
+                names.add(stmt.name)
+            elif kind == NodeKind.IMPORT:
+                if stmt.names is not None:
+                    names.update(stmt.names)
+                if stmt.alias is not None:
+                    names.add(stmt.alias)
+            elif kind == NodeKind.FUNCTION_DEF:
+                names.add(stmt.name)
+                names.update(stmt.parameters)
+                names |= self._bound_names(stmt.body)
+            elif kind == NodeKind.IF:
+                names |= self._bound_names(stmt.then_block)
+                names |= self._bound_names(stmt.else_block)
+            elif kind == NodeKind.WHILE:
+                names |= self._bound_names(stmt.body)
+        return names
+
+    def _compile_statement(self, node: ASTNode) -> Thunk:
+        """Compile a statement into a thunk returning the statement's value"""
+        try:
+            compiler = self._stmt_compilers[type(node)]
+        except KeyError:
+            raise RuntimeError(f"Unknown statement type: {type(node)}") from None
+        return compiler(node)
+
+    def _compile_block(self, statements: list[ASTNode]) -> Thunk:
+        """Compile a block of statements into a thunk returning the last value"""
+        body = [self._compile_statement(stmt) for stmt in statements]
+
+        def block() -> Any:
+            result = None
+            for stmt in body:
+                result = stmt()
+            return result
+
+        return block
+
+    def _compile_import(self, node: ImportStatement) -> Thunk:
+        """Compile an import statement"""
+        return lambda: self._execute_import(node)
 
     def _execute_import(self, node: ImportStatement) -> None:
         """Execute an import statement.
@@ -119,104 +285,216 @@ class Interpreter:
 
         return None
 
-    def _execute_assignment(self, node: Assignment) -> Any:
-        """Execute an assignment statement"""
-        value = self._evaluate_expression(node.value)
-        self.env[node.name] = value
-        return value
+    def _compile_assignment(self, node: Assignment) -> Thunk:
+        """Compile an assignment statement"""
+        name = node.name
+        value = self._compile_expression(node.value)
 
-    def _execute_if(self, node: IfStatement) -> Any:
-        """Execute an if statement"""
-        condition = self._evaluate_expression(node.condition)
-
-        if self._is_truthy(condition):
-            result = None
-            for stmt in node.then_block:
-                result = self._execute_statement(stmt)
+        def assignment() -> Any:
+            result = value()
+            self.env[name] = result
             return result
-        else:
+
+        return assignment
+
+    def _compile_if(self, node: IfStatement) -> Thunk:
+        """Compile an if statement"""
+        condition = self._compile_expression(node.condition)
+        then_block = self._compile_block(node.then_block)
+        else_block = self._compile_block(node.else_block)
+
+        if self._is_comparison(node.condition):
+            # Comparisons already produce a bool
+            def if_statement() -> Any:
+                if condition():
+                    return then_block()
+                return else_block()
+
+            return if_statement
+
+        is_truthy = self._is_truthy
+
+        def if_statement() -> Any:
+            if is_truthy(condition()):
+                return then_block()
+            return else_block()
+
+        return if_statement
+
+    def _compile_while(self, node: WhileStatement) -> Thunk:
+        """Compile a while loop"""
+        condition = self._compile_expression(node.condition)
+        body = [self._compile_statement(stmt) for stmt in node.body]
+
+        if self._is_comparison(node.condition):
+            # Comparisons already produce a bool
+            def while_statement() -> Any:
+                result = None
+                while condition():
+                    for stmt in body:
+                        result = stmt()
+                return result
+
+            return while_statement
+
+        is_truthy = self._is_truthy
+
+        def while_statement() -> Any:
             result = None
-            for stmt in node.else_block:
-                result = self._execute_statement(stmt)
+            while is_truthy(condition()):
+                for stmt in body:
+                    result = stmt()
             return result
 
-    def _execute_while(self, node: WhileStatement) -> Any:
-        """Execute a while loop"""
-        result = None
-        while self._is_truthy(self._evaluate_expression(node.condition)):
-            for stmt in node.body:
-                result = self._execute_statement(stmt)
-        return result
+        return while_statement
 
-    def _execute_function_def(self, node: FunctionDef) -> None:
-        """Store a function definition"""
-        self.functions[node.name] = node
-        return None
+    @staticmethod
+    def _is_comparison(node: ASTNode) -> bool:
+        """Check whether an expression is a comparison, which yields a bool"""
+        return node.kind == NodeKind.BINARY_OP and node.operator in ("==", "<", ">")
 
-    def _evaluate_expression(self, node: ASTNode) -> Any:
-        """Evaluate an expression and return its value"""
-        if isinstance(node, Number):
-            return node.value
-        elif isinstance(node, String):
-            return node.value
-        elif isinstance(node, Variable):
-            if node.name not in self.env:
-                raise RuntimeError(f"Variable '{node.name}' not defined")
-            return self.env[node.name]
-        elif isinstance(node, BinaryOp):
-            return self._evaluate_binary_op(node)
-        elif isinstance(node, Call):
-            return self._evaluate_call(node)
-        elif isinstance(node, ListLiteral):
-            return [self._evaluate_expression(elem) for elem in node.elements]
-        elif isinstance(node, DictLiteral):
+    def _compile_function_def(self, node: FunctionDef) -> Thunk:
+        """Compile a function definition; the body is compiled only once"""
+        body = []
+        for stmt in node.body:
+            body.append(self._compile_statement(stmt))
+            # Statements after a top-level return are never executed
+            if isinstance(stmt, Return):
+                break
+        function = CompiledFunction(node.name, node.parameters, body)
+
+        def function_def() -> None:
+            self.functions[function.name] = function
+            return None
+
+        return function_def
+
+    def _compile_return(self, node: Return) -> Thunk:
+        """Compile a return statement"""
+        return self._compile_expression(node.value)
+
+    def _compile_expression_statement(self, node: ExpressionStatement) -> Thunk:
+        """Compile an expression statement"""
+        return self._compile_expression(node.expression)
+
+    def _compile_expression(self, node: ASTNode) -> Thunk:
+        """Compile an expression into a thunk returning its value"""
+        try:
+            compiler = self._expr_compilers[type(node)]
+        except KeyError:
+            raise RuntimeError(f"Unknown expression type: {type(node)}") from None
+        return compiler(node)
+
+    def _compile_literal(self, node: Number | String) -> Thunk:
+        """Compile a number or string literal"""
+        value = node.value
+        return lambda: value
+
+    def _compile_variable(self, node: Variable) -> Thunk:
+        """Compile a variable lookup"""
+        name = node.name
+
+        def variable() -> Any:
+            try:
+                return self.env[name]
+            except KeyError:
+                raise RuntimeError(f"Variable '{name}' not defined") from None
+
+        return variable
+
+    def _compile_list(self, node: ListLiteral) -> Thunk:
+        """Compile a list literal"""
+        elements = [self._compile_expression(elem) for elem in node.elements]
+        return lambda: [elem() for elem in elements]
+
+    def _compile_dict(self, node: DictLiteral) -> Thunk:
+        """Compile a dictionary literal"""
+        pairs = [
+            (self._compile_expression(key_node), self._compile_expression(value_node))
+            for key_node, value_node in node.pairs
+        ]
+
+        def dict_literal() -> dict[Any, Any]:
             result = {}
-            for key_node, value_node in node.pairs:
-                key = self._evaluate_expression(key_node)
-                value = self._evaluate_expression(value_node)
+            for key_thunk, value_thunk in pairs:
+                key = key_thunk()
+                value = value_thunk()
                 # Validate key is hashable
                 if isinstance(key, list):
                     raise RuntimeError("Dictionary keys cannot be lists (must be hashable)")
                 result[key] = value
             return result
-        else:
-            raise RuntimeError(f"Unknown expression type: {type(node)}")
-
-    def _evaluate_binary_op(self, node: BinaryOp) -> Any:
-        """Evaluate a binary operation"""
-        left = self._evaluate_expression(node.left)
-        right = self._evaluate_expression(node.right)
-
-        if node.operator == "+":
-            return left + right
-        elif node.operator == "-":
-            return left - right
-        elif node.operator == "*":
-            return left * right
-        elif node.operator == "/":
-            return left / right
-        elif node.operator == "==":
-            return left == right
-        elif node.operator == "<":
-            return left < right
-        elif node.operator == ">":
-            return left > right
-        else:
-            raise RuntimeError(f"Unknown operator: {node.operator}")
 
-    def _evaluate_call(self, node: Call) -> Any:
-        """Evaluate a function call.
+        return dict_literal
+
+    def _compile_binary_op(self, node: BinaryOp) -> Thunk:
+        """Compile a binary operation, resolving the operator once"""
+        left = self._compile_expression(node.left)
+        right = self._compile_expression(node.right)
+
+        try:
+            fn = _BINOPS[node.operator]
+        except KeyError:
+            raise RuntimeError(f"Unknown operator: {node.operator}") from None
+        return lambda: fn(left(), right())
+
+    def _compile_call(self, node: Call) -> Thunk:
+        """Compile a function call.
+
+        When the call target cannot change while the script runs, it is
+        resolved here once instead of on every call.
+        """
+        function = node.function
+        arguments = [self._compile_expression(arg) for arg in node.arguments]
+
+        target = self._resolve_static_call(function)
+        if target is not None:
+            return lambda: target(*[arg() for arg in arguments])
+
+        return lambda: self._call(function, [arg() for arg in arguments])
+
+    def _resolve_static_call(self, function: str) -> Callable[..., Any] | None:
+        """Resolve a call target at compile time.
+
+        Returns None when the target must be looked up at runtime, either
+        because the script may rebind the name or because the lookup fails
+        (so the runtime path raises the usual error).
+        """
+        if "." in function:
+            alias, func_name = function.split(".", 1)
+            if alias in self._rebound:
+                return None
+            obj = self.env.get(alias)
+            if isinstance(obj, tuple) and len(obj) == 2 and obj[0] == "__module_alias__":
+                tool = self.tool_map.get(f"{obj[1]}.{func_name}")
+                if tool is not None:
+                    return tool.func
+            return None
+
+        if function in self._rebound:
+            return None
+
+        # Same precedence as _call: user functions, imported tools, builtins
+        if function in self.functions:
+            user_function = self.functions[function]
+            return lambda *args: self._call_user_function(user_function, list(args))
+        if function in self.env:
+            obj = self.env[function]
+            return obj.func if isinstance(obj, Tool) else None
+        if function in self.builtin_map:
+            return self.builtin_map[function].func
+        return None
+
+    def _call(self, function: str, args: list[Any]) -> Any:
+        """Call a function by name.
 
         Supports both:
         - Direct calls: func(args)
         - Module alias calls: alias.func(args)
         """
-        # Evaluate arguments
-        args = [self._evaluate_expression(arg) for arg in node.arguments]
-
         # Check if it's a dotted function name (e.g., ops.plus)
-        if "." in node.function:
-            parts = node.function.split(".", 1)  # Split on first dot only
+        if "." in function:
+            parts = function.split(".", 1)  # Split on first dot only
             alias = parts[0]
             func_name = parts[1]
 
@@ -242,59 +520,58 @@ class Interpreter:
                 raise RuntimeError(f"'{alias}' is not a module alias")
 
         # Check if it's a user-defined function
-        if node.function in self.functions:
-            return self._call_user_function(node.function, args)
+        if function in self.functions:
+            return self._call_user_function(self.functions[function], args)
 
         # Check if it's a tool (imported function) - imported tools take precedence over builtins
-        if node.function in self.env:
-            obj = self.env[node.function]
+        if function in self.env:
+            obj = self.env[function]
             if isinstance(obj, Tool):
                 return obj.func(*args)
             else:
-                raise RuntimeError(f"'{node.function}' is not callable")
+                raise RuntimeError(f"'{function}' is not callable")
 
         # Check if it's a builtin function
-        if node.function in self.builtin_map:
-            builtin_tool = self.builtin_map[node.function]
+        if function in self.builtin_map:
+            builtin_tool = self.builtin_map[function]
             return builtin_tool.func(*args)
 
-        raise RuntimeError(f"Function '{node.function}' not defined")
+        raise RuntimeError(f"Function '{function}' not defined")
 
-    def _call_user_function(self, name: str, args: list[Any]) -> Any:
+    def _call_user_function(self, func_def: CompiledFunction, args: list[Any]) -> Any:
         """Call a user-defined function"""
-        func_def = self.functions[name]
-
         if len(args) != len(func_def.parameters):
             raise RuntimeError(
-                f"Function '{name}' expects {len(func_def.parameters)} arguments, got {len(args)}"
+                f"Function '{func_def.name}' expects {len(func_def.parameters)} arguments, got {len(args)}"
             )
 
-        # Save current environment
-        old_env = self.env.copy()
-
-        # Bind parameters to arguments
-        for param, arg in zip(func_def.parameters, args):
-            self.env[param] = arg
+        # Run the body in a new frame on top of the caller's environment.
+        # Parameters and assignments land in the frame, so they are
+        # discarded when the call returns.
+        caller_env = self.env
+        frame = dict(zip(func_def.parameters, args))
+        if isinstance(caller_env, ChainMap):
+            self.env = caller_env.new_child(frame)
+        else:
+            self.env = ChainMap(frame, caller_env)
 
-        # Execute function body
+        # Execute function body (already truncated after a top-level return)
         result = None
-        for stmt in func_def.body:
-            result = self._execute_statement(stmt)
-            # Check for return statement
-            if isinstance(stmt, Return):
-                break
-
-        # Restore environment
-        self.env = old_env
+        try:
+            for stmt in func_def.body:
+                result = stmt()
+        finally:
+            # Restore environment
+            self.env = caller_env
 
         return result
 
     def _is_truthy(self, value: Any) -> bool:
-        """Determine if a value is truthy"""
-        if isinstance(value, bool):
-            return value
-        if isinstance(value, int) or isinstance(value, float):
+        """Determine if a value is truthy.
+
+        Numbers (including bools) are truthy when non-zero, None is falsy and
+        every other value, even an empty string or list, is truthy.
+        """
+        if isinstance(value, (int, float)):
             return value != 0
-        if value is None:
-            return False
-        return True
+        return value is not None
@@ -1,9 +1,13 @@
-from enum import Enum, auto
+import re
+from enum import Enum, IntEnum, auto
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Iterator
 
 
-class TokenType(Enum):
+class TokenType(IntEnum):
+    # Keep "TokenType.NAME" in error messages rather than the bare number
+    __str__ = Enum.__str__
+
     # Literals
     NUMBER = auto()
     STRING = auto()
@@ -52,79 +56,107 @@ class Token:
     line: int
 
 
+# One alternative per token class; the first matching alternative wins, so
+# triple quotes must come before the single-quote forms. Strings only match
+# their opening quote here; the closing quote is located with str.find.
+# Identifiers, keywords and operators share one group and are told apart by
+# a single TOKEN_TYPES lookup.
+TOKEN_RE = re.compile(
+    r"""
+    (?P<WORD>[^\W\d]\w*|==|[+\-*/=<>(){}\[\],.:])
+    |(?P<NUMBER>\d+)
+    |(?P<STRING>\"\"\"|'''|"|')
+    |(?P<NEWLINE>\n)
+    |(?P<WHITESPACE>[ \t\r]+)
+    |(?P<COMMENT>\#[^\n]*)
+    """,
+    re.VERBOSE,
+)
+
+# Group numbers of the token classes, so tokenize can dispatch on the
+# integer match.lastindex instead of comparing group-name strings
+_WORD = TOKEN_RE.groupindex["WORD"]
+_NUMBER = TOKEN_RE.groupindex["NUMBER"]
+_STRING = TOKEN_RE.groupindex["STRING"]
+_NEWLINE = TOKEN_RE.groupindex["NEWLINE"]
+
+INDENT_RE = re.compile(r"[ \t]*")
+
+# Characters that make a line blank for indentation purposes
+_BLANK_LINE_START = frozenset("\r\n#")
+
+# Shared result of handle_indentation for lines that produce no tokens
+_NO_TOKENS: tuple[Token, ...] = ()
+
+KEYWORDS = {
+    "if": TokenType.IF,
+    "else": TokenType.ELSE,
+    "while": TokenType.WHILE,
+    "def": TokenType.DEF,
+    "return": TokenType.RETURN,
+    "from": TokenType.FROM,
+    "import": TokenType.IMPORT,
+    "as": TokenType.AS,
+}
+
+OPERATORS = {
+    "+": TokenType.PLUS,
+    "-": TokenType.MINUS,
+    "*": TokenType.STAR,
+    "/": TokenType.SLASH,
+    "=": TokenType.EQUAL,
+    "==": TokenType.EQUAL_EQUAL,
+    "<": TokenType.LESS,
+    ">": TokenType.GREATER,
+    "(": TokenType.LPAREN,
+    ")": TokenType.RPAREN,
+    "{": TokenType.LBRACE,
+    "}": TokenType.RBRACE,
+    "[": TokenType.LBRACKET,
+    "]": TokenType.RBRACKET,
+    ",": TokenType.COMMA,
+    ".": TokenType.DOT,
+    ":": TokenType.COLON,
+}
+
+# Token type of every fixed word: keywords and operators
+TOKEN_TYPES = {**KEYWORDS, **OPERATORS}
+
+
 class Lexer:
     def __init__(self, source: str):
         self.source = source
+        self._source_len = len(source)
         self.pos = 0
         self.line = 1
-        self.column = 0
         self.at_line_start = True
         self.indent_stack = [0]  # Stack of indentation levels
-        self.keywords = {
-            "if": TokenType.IF,
-            "else": TokenType.ELSE,
-            "while": TokenType.WHILE,
-            "def": TokenType.DEF,
-            "return": TokenType.RETURN,
-            "from": TokenType.FROM,
-            "import": TokenType.IMPORT,
-            "as": TokenType.AS,
-        }
-
-    def current_char(self):
-        if self.pos >= len(self.source):
-            return ""
-        return self.source[self.pos]
-
-    def peek(self, offset=1):
-        """Peek ahead at a character without advancing position"""
-        pos = self.pos + offset
-        if pos >= len(self.source):
-            return ""
-        return self.source[pos]
-
-    def advance(self):
-        if self.current_char() == "\n":
-            self.line += 1
-            self.column = 0
-            self.at_line_start = True
-        else:
-            self.column += 1
-        self.pos += 1
-
-    def skip_whitespace(self):
-        # Only skip inline whitespace, not leading whitespace at line start
-        while self.current_char() in " \t\r" and not self.at_line_start:
-            self.advance()
 
     def handle_indentation(self):
         """Handle indentation at the start of a line, return INDENT/DEDENT tokens"""
-        if not self.at_line_start:
-            return []
-
-        # Count leading spaces/tabs
-        indent_level = 0
-        while self.current_char() in " \t":
-            if self.current_char() == " ":
-                indent_level += 1
-            else:  # tab
-                indent_level += 4  # treat tab as 4 spaces
-            self.advance()
-
         self.at_line_start = False
 
+        # Consume leading spaces/tabs
+        match = INDENT_RE.match(self.source, self.pos)
+        self.pos = match.end()
+
         # Skip blank lines and comments
-        if self.current_char() in "\n#" or not self.current_char():
-            return []
+        if self.pos >= self._source_len or self.source[self.pos] in _BLANK_LINE_START:
+            return _NO_TOKENS
+
+        indent = match.group()
+        indent_level = indent.count(" ") + 4 * indent.count("\t")  # tab = 4 spaces
 
-        tokens = []
         current_indent = self.indent_stack[-1]
+        if indent_level == current_indent:
+            return _NO_TOKENS
 
+        tokens = []
         if indent_level > current_indent:
             # Indentation increased
             self.indent_stack.append(indent_level)
             tokens.append(Token(TokenType.INDENT, None, self.line))
-        elif indent_level < current_indent:
+        else:
             # Indentation decreased - may need multiple DEDENTs
             while len(self.indent_stack) > 1 and self.indent_stack[-1] > indent_level:
                 self.indent_stack.pop()
@@ -135,151 +167,71 @@ class Lexer:
 
         return tokens
 
-    def read_number(self):
-        num = ""
-        while self.current_char() and self.current_char().isdigit():
-            num += self.current_char()
-            self.advance()
-        return int(num)
-
-    def read_identifier(self):
-        ident = ""
-        while self.current_char() and (self.current_char().isalnum() or self.current_char() == "_"):
-            ident += self.current_char()
-            self.advance()
-        return ident
-
-    def read_string(self, quote_char):
-        self.advance()  # skip opening quote
-        string = ""
-        while self.current_char() and self.current_char() != quote_char:
-            string += self.current_char()
-            self.advance()
-        self.advance()  # skip closing quote
-        return string
-
-    def read_multiline_string(self, quote_char):
-        """Read a multiline string delimited by triple quotes (''' or \"\"\")"""
-        # Skip opening triple quotes
-        self.advance()  # skip first quote
-        self.advance()  # skip second quote
-        self.advance()  # skip third quote
-
-        string = ""
-        while self.current_char():
-            # Check for closing triple quotes
-            if (self.current_char() == quote_char and
-                self.peek(1) == quote_char and
-                self.peek(2) == quote_char):
-                # Skip closing triple quotes
-                self.advance()
-                self.advance()
-                self.advance()
-                return string
-
-            string += self.current_char()
-            self.advance()
-
-        raise SyntaxError(f"Unterminated multiline string starting at line {self.line}")
-
     def tokenize(self):
-        tokens = []
+        """Tokenize the whole source into a list"""
+        return list(self)
+
+    def __iter__(self) -> Iterator[Token]:
+        """Yield tokens on demand, ending with EOF"""
+        match_token = TOKEN_RE.match
+        source = self.source
+        source_len = self._source_len
+        pos = self.pos
 
-        while self.current_char():
+        while pos < source_len:
             # Handle indentation at line start
-            indent_tokens = self.handle_indentation()
-            tokens.extend(indent_tokens)
-
-            self.skip_whitespace()
-
-            if not self.current_char():
-                break
-
-            # Numbers
-            if self.current_char().isdigit():
-                tokens.append(Token(TokenType.NUMBER, self.read_number(), self.line))
-
-            # Identifiers and keywords
-            elif self.current_char().isalpha() or self.current_char() == "_":
-                ident = self.read_identifier()
-                token_type = self.keywords.get(ident, TokenType.IDENTIFIER)
-                tokens.append(Token(token_type, ident, self.line))
-
-            # Strings (check for triple quotes first, then single quotes)
-            elif self.current_char() == "\"":
-                if self.peek(1) == "\"" and self.peek(2) == "\"":
-                    tokens.append(Token(TokenType.STRING, self.read_multiline_string("\""), self.line))
-                else:
-                    tokens.append(Token(TokenType.STRING, self.read_string("\""), self.line))
-            elif self.current_char() == "'":
-                if self.peek(1) == "'" and self.peek(2) == "'":
-                    tokens.append(Token(TokenType.STRING, self.read_multiline_string("'"), self.line))
-                else:
-                    tokens.append(Token(TokenType.STRING, self.read_string("'"), self.line))
-
-            # Operators and punctuation
-            elif self.current_char() == "+":
-                tokens.append(Token(TokenType.PLUS, "+", self.line))
-                self.advance()
-            elif self.current_char() == "-":
-                tokens.append(Token(TokenType.MINUS, "-", self.line))
-                self.advance()
-            elif self.current_char() == "*":
-                tokens.append(Token(TokenType.STAR, "*", self.line))
-                self.advance()
-            elif self.current_char() == "/":
-                tokens.append(Token(TokenType.SLASH, "/", self.line))
-                self.advance()
-            elif self.current_char() == "=":
-                self.advance()
-                if self.current_char() == "=":
-                    tokens.append(Token(TokenType.EQUAL_EQUAL, "==", self.line))
-                    self.advance()
-                else:
-                    tokens.append(Token(TokenType.EQUAL, "=", self.line))
-            elif self.current_char() == "<":
-                tokens.append(Token(TokenType.LESS, "<", self.line))
-                self.advance()
-            elif self.current_char() == ">":
-                tokens.append(Token(TokenType.GREATER, ">", self.line))
-                self.advance()
-            elif self.current_char() == "(":
-                tokens.append(Token(TokenType.LPAREN, "(", self.line))
-                self.advance()
-            elif self.current_char() == ")":
-                tokens.append(Token(TokenType.RPAREN, ")", self.line))
-                self.advance()
-            elif self.current_char() == "{":
-                tokens.append(Token(TokenType.LBRACE, "{", self.line))
-                self.advance()
-            elif self.current_char() == "}":
-                tokens.append(Token(TokenType.RBRACE, "}", self.line))
-                self.advance()
-            elif self.current_char() == "[":
-                tokens.append(Token(TokenType.LBRACKET, "[", self.line))
-                self.advance()
-            elif self.current_char() == "]":
-                tokens.append(Token(TokenType.RBRACKET, "]", self.line))
-                self.advance()
-            elif self.current_char() == ",":
-                tokens.append(Token(TokenType.COMMA, ",", self.line))
-                self.advance()
-            elif self.current_char() == ".":
-                tokens.append(Token(TokenType.DOT, ".", self.line))
-                self.advance()
-            elif self.current_char() == ":":
-                tokens.append(Token(TokenType.COLON, ":", self.line))
-                self.advance()
-            elif self.current_char() == "\n":
-                tokens.append(Token(TokenType.NEWLINE, "\n", self.line))
-                self.advance()
-            else:
-                raise SyntaxError(f"Unexpected character: {self.current_char()} at line {self.line}")
+            if self.at_line_start:
+                self.pos = pos
+                yield from self.handle_indentation()
+                pos = self.pos
+                if pos >= source_len:
+                    break
+
+            match = match_token(source, pos)
+            if match is None:
+                self.pos = pos
+                self._raise_unexpected()
+
+            kind = match.lastindex
+            text = match.group()
+            pos = match.end()
+
+            if kind == _WORD:
+                # Every operator is in the table; unknown words are identifiers
+                token_type = TOKEN_TYPES.get(text, TokenType.IDENTIFIER)
+                yield Token(token_type, text, self.line)
+            elif kind == _NUMBER:
+                yield Token(TokenType.NUMBER, int(text), self.line)
+            elif kind == _STRING:
+                # text is the opening quote; the string runs to the next
+                # occurrence of the same quote
+                end = source.find(text, pos)
+                if end == -1:
+                    if len(text) == 3:
+                        raise SyntaxError(
+                            f"Unterminated multiline string starting at line {self.line}"
+                        )
+                    raise SyntaxError(f"Unterminated string starting at line {self.line}")
+                value = source[pos:end]
+                yield Token(TokenType.STRING, value, self.line)
+                self.line += value.count("\n")
+                pos = end + len(text)
+            elif kind == _NEWLINE:
+                yield Token(TokenType.NEWLINE, "\n", self.line)
+                self.line += 1
+                self.at_line_start = True
+            # Whitespace and comments produce no tokens
+
+        self.pos = pos
 
         # Add DEDENT tokens for any remaining indentation levels
         while len(self.indent_stack) > 1:
             self.indent_stack.pop()
-            tokens.append(Token(TokenType.DEDENT, None, self.line))
+            yield Token(TokenType.DEDENT, None, self.line)
 
-        tokens.append(Token(TokenType.EOF, None, self.line))
-        return tokens
+        yield Token(TokenType.EOF, None, self.line)
+
+    def _raise_unexpected(self):
+        """Raise a SyntaxError for the character at the current position"""
+        char = self.source[self.pos]
+        raise SyntaxError(f"Unexpected character: {char} at line {self.line}")
@@ -1,125 +1,197 @@
+from collections import deque
 from dataclasses import dataclass
+from enum import IntEnum, auto
+from typing import ClassVar
 
 from src.simple_script.lexer import TokenType
 
 
-@dataclass
+class NodeKind(IntEnum):
+    """Integer tag identifying the class of an AST node"""
+    # Expressions
+    NUMBER = auto()
+    STRING = auto()
+    VARIABLE = auto()
+    BINARY_OP = auto()
+    CALL = auto()
+    LIST = auto()
+    DICT = auto()
+
+    # Statements
+    IMPORT = auto()
+    ASSIGNMENT = auto()
+    IF = auto()
+    WHILE = auto()
+    FUNCTION_DEF = auto()
+    RETURN = auto()
+    EXPRESSION_STATEMENT = auto()
+
+
+@dataclass(slots=True)
 class ASTNode:
-    pass
+    kind: ClassVar[NodeKind]
 
 
 # Expressions
-@dataclass
+@dataclass(slots=True)
 class Number(ASTNode):
+    kind: ClassVar[NodeKind] = NodeKind.NUMBER
     value: int
 
 
-@dataclass
+@dataclass(slots=True)
 class String(ASTNode):
+    kind: ClassVar[NodeKind] = NodeKind.STRING
     value: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Variable(ASTNode):
+    kind: ClassVar[NodeKind] = NodeKind.VARIABLE
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BinaryOp(ASTNode):
+    kind: ClassVar[NodeKind] = NodeKind.BINARY_OP
     left: ASTNode
     operator: str
     right: ASTNode
 
 
-@dataclass
+@dataclass(slots=True)
 class Call(ASTNode):
+    kind: ClassVar[NodeKind] = NodeKind.CALL
     function: str
     arguments: list[ASTNode]
 
 
-@dataclass
+@dataclass(slots=True)
 class ListLiteral(ASTNode):
+    kind: ClassVar[NodeKind] = NodeKind.LIST
     elements: list[ASTNode]
 
 
-@dataclass
+@dataclass(slots=True)
 class DictLiteral(ASTNode):
+    kind: ClassVar[NodeKind] = NodeKind.DICT
     pairs: list[tuple[ASTNode, ASTNode]]
 
 
 # Statements
-@dataclass
+@dataclass(slots=True)
 class ImportStatement(ASTNode):
+    kind: ClassVar[NodeKind] = NodeKind.IMPORT
     module_path: str
     names: list[str] | None = None  # For selective imports: from X import a, b
     alias: str | None = None  # For module aliases: import X as Y
 
 
-@dataclass
+@dataclass(slots=True)
 class Assignment(ASTNode):
+    kind: ClassVar[NodeKind] = NodeKind.ASSIGNMENT
     name: str
     value: ASTNode
 
 
-@dataclass
+@dataclass(slots=True)
 class IfStatement(ASTNode):
+    kind: ClassVar[NodeKind] = NodeKind.IF
     condition: ASTNode
     then_block: list[ASTNode]
     else_block: list[ASTNode]
 
 
-@dataclass
+@dataclass(slots=True)
 class WhileStatement(ASTNode):
+    kind: ClassVar[NodeKind] = NodeKind.WHILE
     condition: ASTNode
     body: list[ASTNode]
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionDef(ASTNode):
+    kind: ClassVar[NodeKind] = NodeKind.FUNCTION_DEF
     name: str
     parameters: list[str]
     body: list[ASTNode]
 
 
-@dataclass
+@dataclass(slots=True)
 class Return(ASTNode):
+    kind: ClassVar[NodeKind] = NodeKind.RETURN
     value: ASTNode
 
 
-@dataclass
+@dataclass(slots=True)
 class ExpressionStatement(ASTNode):
+    kind: ClassVar[NodeKind] = NodeKind.EXPRESSION_STATEMENT
     expression: ASTNode
 
 
+# Binding power of the binary operators; higher binds tighter
+PRECEDENCE = {
+    TokenType.EQUAL_EQUAL: 1,
+    TokenType.LESS: 1,
+    TokenType.GREATER: 1,
+    TokenType.PLUS: 2,
+    TokenType.MINUS: 2,
+    TokenType.STAR: 3,
+    TokenType.SLASH: 3,
+}
+
+# Tokens that can continue an identifier in an expression (alias.func, f(...))
+_NAME_TRAILERS = frozenset({TokenType.DOT, TokenType.LPAREN})
+
+
 class Parser:
     def __init__(self, tokens):
-        self.tokens = tokens
-        self.pos = 0
-
-    def current_token(self):
-        if self.pos >= len(self.tokens):
-            return self.tokens[-1]  # EOF
-        return self.tokens[self.pos]
+        # Tokens may be any iterable ending with EOF (a token list or a
+        # Lexer); they are pulled one at a time as parsing proceeds
+        self._tokens = iter(tokens)
+        self._lookahead = deque()  # Tokens read ahead by peek()
+        self.current = next(self._tokens)  # Token being looked at
+        # Statement parsers keyed by the token that starts the statement
+        self._statement_parsers = {
+            TokenType.FROM: self.parse_import_statement,
+            TokenType.IMPORT: self.parse_import_statement,
+            TokenType.DEF: self.parse_function_def,
+            TokenType.IF: self.parse_if_statement,
+            TokenType.WHILE: self.parse_while_statement,
+            TokenType.RETURN: self.parse_return_statement,
+            TokenType.IDENTIFIER: self.parse_assignment_or_expression,
+        }
 
     def advance(self):
-        self.pos += 1
+        if self._lookahead:
+            self.current = self._lookahead.popleft()
+        elif self.current.type != TokenType.EOF:
+            self.current = next(self._tokens)
+
+    def peek(self):
+        """Return the token after the current one without consuming anything"""
+        if not self._lookahead:
+            if self.current.type == TokenType.EOF:
+                return self.current
+            self._lookahead.append(next(self._tokens))
+        return self._lookahead[0]
 
     def expect(self, token_type):
-        if self.current_token().type != token_type:
-            raise SyntaxError(f"Expected {token_type}, got {self.current_token().type}")
-        token = self.current_token()
+        token = self.current
+        if token.type != token_type:
+            raise SyntaxError(f"Expected {token_type}, got {token.type}")
         self.advance()
         return token
 
     def skip_newlines(self):
-        while self.current_token().type == TokenType.NEWLINE:
+        while self.current.type == TokenType.NEWLINE:
             self.advance()
 
     def parse(self):
         statements = []
         self.skip_newlines()
 
-        while self.current_token().type != TokenType.EOF:
+        while self.current.type != TokenType.EOF:
             statements.append(self.parse_statement())
             self.skip_newlines()
 
@@ -128,47 +200,33 @@ class Parser:
     def parse_statement(self):
         self.skip_newlines()
 
-        # Import statement (both styles)
-        if self.current_token().type in (TokenType.FROM, TokenType.IMPORT):
-            return self.parse_import_statement()
+        parse = self._statement_parsers.get(self.current.type)
+        if parse is not None:
+            return parse()
 
-        # Function definition
-        if self.current_token().type == TokenType.DEF:
-            return self.parse_function_def()
-
-        # If statement
-        if self.current_token().type == TokenType.IF:
-            return self.parse_if_statement()
-
-        # While statement
-        if self.current_token().type == TokenType.WHILE:
-            return self.parse_while_statement()
+        # Just an expression
+        return self.parse_expression_statement()
 
-        # Return statement
-        if self.current_token().type == TokenType.RETURN:
-            self.advance()
+    def parse_return_statement(self):
+        self.expect(TokenType.RETURN)
+        value = self.parse_expression()
+        self.skip_newlines()
+        return Return(value)
+
+    def parse_assignment_or_expression(self):
+        """Parse a statement starting with an identifier"""
+        if self.peek().type == TokenType.EQUAL:
+            name = self.current.value
+            self.advance()  # skip name
+            self.advance()  # skip =
             value = self.parse_expression()
             self.skip_newlines()
-            return Return(value)
-
-        # Assignment or expression
-        if self.current_token().type == TokenType.IDENTIFIER:
-            name = self.current_token().value
-            self.advance()
+            return Assignment(name, value)
 
-            if self.current_token().type == TokenType.EQUAL:
-                self.advance()
-                value = self.parse_expression()
-                self.skip_newlines()
-                return Assignment(name, value)
-            else:
-                # It's a function call
-                self.pos -= 1  # backtrack
-                expr = self.parse_expression()
-                self.skip_newlines()
-                return ExpressionStatement(expr)
+        # It's a function call
+        return self.parse_expression_statement()
 
-        # Just an expression
+    def parse_expression_statement(self):
         expr = self.parse_expression()
         self.skip_newlines()
         return ExpressionStatement(expr)
@@ -180,26 +238,21 @@ class Parser:
         1. from module.path import name1, name2
         2. import module.path as alias
         """
-        current = self.current_token()
+        current = self.current
 
         if current.type == TokenType.FROM:
             # Selective import: from module import name1, name2
             self.expect(TokenType.FROM)
 
             # Parse module path (e.g., mymodule.submodule)
-            module_parts = []
-            module_parts.append(self.expect(TokenType.IDENTIFIER).value)
-            while self.current_token().type == TokenType.DOT:
-                self.advance()  # skip dot
-                module_parts.append(self.expect(TokenType.IDENTIFIER).value)
-            module_path = ".".join(module_parts)
+            module_path = self._parse_dotted_name()
 
             self.expect(TokenType.IMPORT)
 
             # Parse import names
             names = []
             names.append(self.expect(TokenType.IDENTIFIER).value)
-            while self.current_token().type == TokenType.COMMA:
+            while self.current.type == TokenType.COMMA:
                 self.advance()  # skip comma
                 names.append(self.expect(TokenType.IDENTIFIER).value)
 
@@ -211,12 +264,7 @@ class Parser:
             self.expect(TokenType.IMPORT)
 
             # Parse module path (e.g., mymodule.submodule)
-            module_parts = []
-            module_parts.append(self.expect(TokenType.IDENTIFIER).value)
-            while self.current_token().type == TokenType.DOT:
-                self.advance()  # skip dot
-                module_parts.append(self.expect(TokenType.IDENTIFIER).value)
-            module_path = ".".join(module_parts)
+            module_path = self._parse_dotted_name()
 
             # Expect 'as' keyword
             self.expect(TokenType.AS)
@@ -230,15 +278,28 @@ class Parser:
         else:
             raise SyntaxError(f"Expected 'from' or 'import', got {current.type}")
 
+    def _parse_dotted_name(self, first: str | None = None) -> str:
+        """Parse an identifier optionally followed by .identifier parts.
+
+        If `first` is given, the leading identifier has already been consumed.
+        """
+        if first is None:
+            first = self.expect(TokenType.IDENTIFIER).value
+        parts = [first]
+        while self.current.type == TokenType.DOT:
+            self.advance()  # skip dot
+            parts.append(self.expect(TokenType.IDENTIFIER).value)
+        return parts[0] if len(parts) == 1 else ".".join(parts)
+
     def parse_function_def(self):
         self.expect(TokenType.DEF)
         name = self.expect(TokenType.IDENTIFIER).value
         self.expect(TokenType.LPAREN)
 
         parameters = []
-        if self.current_token().type != TokenType.RPAREN:
+        if self.current.type != TokenType.RPAREN:
             parameters.append(self.expect(TokenType.IDENTIFIER).value)
-            while self.current_token().type == TokenType.COMMA:
+            while self.current.type == TokenType.COMMA:
                 self.advance()
                 parameters.append(self.expect(TokenType.IDENTIFIER).value)
 
@@ -248,7 +309,7 @@ class Parser:
         self.expect(TokenType.INDENT)
 
         body = []
-        while self.current_token().type != TokenType.DEDENT:
+        while self.current.type != TokenType.DEDENT:
             body.append(self.parse_statement())
             self.skip_newlines()
 
@@ -265,7 +326,7 @@ class Parser:
         self.expect(TokenType.INDENT)
 
         then_block = []
-        while self.current_token().type != TokenType.DEDENT:
+        while self.current.type != TokenType.DEDENT:
             then_block.append(self.parse_statement())
             self.skip_newlines()
 
@@ -273,13 +334,13 @@ class Parser:
         self.skip_newlines()
 
         else_block = []
-        if self.current_token().type == TokenType.ELSE:
+        if self.current.type == TokenType.ELSE:
             self.advance()
             self.expect(TokenType.COLON)
             self.skip_newlines()
             self.expect(TokenType.INDENT)
 
-            while self.current_token().type != TokenType.DEDENT:
+            while self.current.type != TokenType.DEDENT:
                 else_block.append(self.parse_statement())
                 self.skip_newlines()
 
@@ -296,7 +357,7 @@ class Parser:
         self.expect(TokenType.INDENT)
 
         body = []
-        while self.current_token().type != TokenType.DEDENT:
+        while self.current.type != TokenType.DEDENT:
             body.append(self.parse_statement())
             self.skip_newlines()
 
@@ -305,77 +366,57 @@ class Parser:
 
         return WhileStatement(condition, body)
 
-    def parse_expression(self):
-        return self.parse_comparison()
-
-    def parse_comparison(self):
-        left = self.parse_addition()
-
-        while self.current_token().type in (
-            TokenType.EQUAL_EQUAL,
-            TokenType.LESS,
-            TokenType.GREATER,
-        ):
-            op = self.current_token().value
-            self.advance()
-            right = self.parse_addition()
-            left = BinaryOp(left, op, right)
-
-        return left
-
-    def parse_addition(self):
-        left = self.parse_multiplication()
+    def parse_expression(self, min_precedence=1):
+        """Parse a binary expression by precedence climbing.
 
-        while self.current_token().type in (TokenType.PLUS, TokenType.MINUS):
-            op = self.current_token().value
-            self.advance()
-            right = self.parse_multiplication()
-            left = BinaryOp(left, op, right)
-
-        return left
-
-    def parse_multiplication(self):
+        Only operators binding at least as tightly as min_precedence are
+        consumed; operators of equal precedence associate to the left.
+        """
         left = self.parse_primary()
 
-        while self.current_token().type in (TokenType.STAR, TokenType.SLASH):
-            op = self.current_token().value
+        while True:
+            token = self.current
+            precedence = PRECEDENCE.get(token.type, 0)
+            if precedence < min_precedence:
+                return left
             self.advance()
-            right = self.parse_primary()
-            left = BinaryOp(left, op, right)
-
-        return left
+            right = self.parse_expression(precedence + 1)
+            left = BinaryOp(left, token.value, right)
 
     def parse_primary(self):
+        token = self.current
+        token_type = token.type
+
         # Number
-        if self.current_token().type == TokenType.NUMBER:
-            value = self.current_token().value
+        if token_type == TokenType.NUMBER:
             self.advance()
-            return Number(value)
+            return Number(token.value)
 
         # String
-        if self.current_token().type == TokenType.STRING:
-            value = self.current_token().value
+        if token_type == TokenType.STRING:
             self.advance()
-            return String(value)
+            return String(token.value)
 
         # Variable or function call (possibly dotted, e.g., alias.func)
-        if self.current_token().type == TokenType.IDENTIFIER:
-            name = self.current_token().value
+        if token_type == TokenType.IDENTIFIER:
+            name = token.value
             self.advance()
 
+            # Plain variable, by far the most common case
+            if self.current.type not in _NAME_TRAILERS:
+                return Variable(name)
+
             # Handle dotted names (e.g., ops.plus)
-            while self.current_token().type == TokenType.DOT:
-                self.advance()  # skip dot
-                name += "." + self.expect(TokenType.IDENTIFIER).value
+            name = self._parse_dotted_name(name)
 
             # Function call
-            if self.current_token().type == TokenType.LPAREN:
+            if self.current.type == TokenType.LPAREN:
                 self.advance()
                 arguments = []
 
-                if self.current_token().type != TokenType.RPAREN:
+                if self.current.type != TokenType.RPAREN:
                     arguments.append(self.parse_expression())
-                    while self.current_token().type == TokenType.COMMA:
+                    while self.current.type == TokenType.COMMA:
                         self.advance()
                         arguments.append(self.parse_expression())
 
@@ -386,20 +427,20 @@ class Parser:
             return Variable(name)
 
         # Parenthesized expression
-        if self.current_token().type == TokenType.LPAREN:
+        if token_type == TokenType.LPAREN:
             self.advance()
             expr = self.parse_expression()
             self.expect(TokenType.RPAREN)
             return expr
 
         # List literal
-        if self.current_token().type == TokenType.LBRACKET:
+        if token_type == TokenType.LBRACKET:
             self.advance()
             elements = []
 
-            if self.current_token().type != TokenType.RBRACKET:
+            if self.current.type != TokenType.RBRACKET:
                 elements.append(self.parse_expression())
-                while self.current_token().type == TokenType.COMMA:
+                while self.current.type == TokenType.COMMA:
                     self.advance()
                     elements.append(self.parse_expression())
 
@@ -407,11 +448,11 @@ class Parser:
             return ListLiteral(elements)
 
         # Dictionary literal
-        if self.current_token().type == TokenType.LBRACE:
+        if token_type == TokenType.LBRACE:
             self.advance()
             pairs = []
 
-            if self.current_token().type != TokenType.RBRACE:
+            if self.current.type != TokenType.RBRACE:
                 # Parse first key-value pair
                 key = self.parse_expression()
                 self.expect(TokenType.COLON)
@@ -419,10 +460,10 @@ class Parser:
                 pairs.append((key, value))
 
                 # Parse remaining pairs
-                while self.current_token().type == TokenType.COMMA:
+                while self.current.type == TokenType.COMMA:
                     self.advance()
                     # Allow trailing comma
-                    if self.current_token().type == TokenType.RBRACE:
+                    if self.current.type == TokenType.RBRACE:
                         break
                     key = self.parse_expression()
                     self.expect(TokenType.COLON)
@@ -432,4 +473,4 @@ class Parser:
             self.expect(TokenType.RBRACE)
             return DictLiteral(pairs)
 
-        raise SyntaxError(f"Unexpected token: {self.current_token()}")
+        raise SyntaxError(f"Unexpected token: {token}")
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Callable
 
 from pydantic_ai import Tool as PydanticTool
@@ -23,24 +25,15 @@ class Tool:
     @classmethod
     def from_function(cls, func: Callable[..., Any]) -> Tool:
         """Create a Tool from a function using pydantic-ai introspection."""
-        pydantic_tool = PydanticTool(func, takes_ctx=False)
-
-        # Extract parameters from JSON schema
-        parameters = []
-        json_schema = pydantic_tool.function_schema.json_schema
-        if "properties" in json_schema:
-            for param_name, param_schema in json_schema["properties"].items():
-                param_type = param_schema.get("type", None)
-                # Handle array types
-                if param_type == "array":
-                    items_type = param_schema.get("items", {}).get("type", "any")
-                    param_type = f"list[{items_type}]"
-                parameters.append(ToolParameter(name=param_name, type=param_type))
+        name, description, params = _introspect_function(func)
+
+        # Always return a new Tool: callers are free to rename the result
+        parameters = [ToolParameter(name=n, type=t) for n, t in params]
 
         return cls(
-            name=pydantic_tool.name,
+            name=name,
             func=func,
-            description=pydantic_tool.description or "No description available",
+            description=description,
             parameters=parameters if parameters else None,
         )
 
@@ -48,26 +41,63 @@ class Tool:
     def from_mcp_tool(cls, mcp_tool: Any, func: Callable[..., Any]) -> Tool:
         """Create a Tool from an MCP tool object."""
         # Extract parameters from inputSchema
-        parameters = []
         input_schema = None
+        params: tuple[tuple[str, str | None], ...] = ()
         if hasattr(mcp_tool, "inputSchema") and mcp_tool.inputSchema:
             input_schema = mcp_tool.inputSchema
-            properties = input_schema.get("properties", {})
-            for param_name, param_schema in properties.items():
-                param_type = param_schema.get("type", None)
-                # Handle array types
-                if param_type == "array":
-                    items = param_schema.get("items", {})
-                    items_type = (
-                        items.get("type", "any") if isinstance(items, dict) else "any"
-                    )
-                    param_type = f"list[{items_type}]"
-                parameters.append(ToolParameter(name=param_name, type=param_type))
+            params = _extract_params(input_schema)
+        parameters = [ToolParameter(name=n, type=t) for n, t in params]
 
         return cls(
-            name=mcp_tool.name,
+            # Interned, as names are matched against interned mapping patterns
+            name=sys.intern(mcp_tool.name),
             func=func,
             description=mcp_tool.description or "No description available",
             parameters=parameters if parameters else None,
             inputSchema=input_schema,
         )
+
+
+@lru_cache(maxsize=256)
+def _introspect_function(
+    func: Callable[..., Any],
+) -> tuple[str, str, tuple[tuple[str, str | None], ...]]:
+    """Introspect a function once, returning its name, description and parameters."""
+    pydantic_tool = PydanticTool(func, takes_ctx=False)
+
+    params = _extract_params(pydantic_tool.function_schema.json_schema)
+
+    return (
+        pydantic_tool.name,
+        pydantic_tool.description or "No description available",
+        params,
+    )
+
+
+# Precomputed parameter types for the common array item types
+_LIST_TYPE = {
+    "integer": "list[integer]",
+    "number": "list[number]",
+    "string": "list[string]",
+    "boolean": "list[boolean]",
+    "object": "list[object]",
+    "any": "list[any]",
+}
+
+
+def _extract_params(schema: dict[str, Any]) -> tuple[tuple[str, str | None], ...]:
+    """Extract (name, type) pairs from the properties of a JSON schema."""
+    parameters = []
+    for param_name, param_schema in schema.get("properties", {}).items():
+        param_type = param_schema.get("type", None)
+        # Handle array types
+        if param_type == "array":
+            items = param_schema.get("items", {})
+            items_type = items.get("type", "any") if isinstance(items, dict) else "any"
+            if isinstance(items_type, str) and items_type in _LIST_TYPE:
+                param_type = _LIST_TYPE[items_type]
+            else:
+                # items.type may also be a list, e.g. ["string", "null"]
+                param_type = f"list[{items_type}]"
+        parameters.append((param_name, param_type))
+    return tuple(parameters)
@@ -1,11 +1,27 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import hashlib
+import os
+import pickle
+from dataclasses import dataclass, fields
+from pathlib import Path
 from typing import Optional
 
 import yaml
 from mcp import StdioServerParameters
 
+try:
+    # C-backed loader, available when PyYAML is built with libyaml
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
+
+# Parsed configurations are cached here, one file per config path, and
+# reused while the YAML content and the config classes' fields are unchanged.
+# Bump CACHE_VERSION when the config classes change shape in other ways.
+CACHE_DIR = Path.home() / ".cache" / "switchboard"
+CACHE_VERSION = b"2"
+
 
 @dataclass
 class StdioConfig:
@@ -53,10 +69,45 @@ class MCPServerConfig:
 
     @classmethod
     def from_yaml(cls, yaml_path: str) -> list[MCPServerConfig]:
-        """Load MCP server configurations from YAML file."""
-        with open(yaml_path, "r") as f:
-            data = yaml.safe_load(f)
+        """Load MCP server configurations from YAML file.
+
+        Parsed configurations are cached on disk together with a hash of the
+        file content, so an unchanged file is not parsed again on the next
+        start. Each config path has a single cache file, which is replaced
+        when the content changes.
+        """
+        with open(yaml_path, "rb") as f:
+            raw = f.read()
+
+        digest = hashlib.sha256(CACHE_VERSION + _CACHE_SCHEMA + raw).hexdigest()
+        path_key = hashlib.sha256(os.fsencode(os.path.abspath(yaml_path))).hexdigest()
+        cache_path = CACHE_DIR / f"{path_key}.pkl"
+        try:
+            with open(cache_path, "rb") as f:
+                cached_digest, servers = pickle.load(f)
+            if cached_digest == digest:
+                return servers
+        except Exception:
+            # Missing or unreadable cache - parse the YAML instead
+            pass
+
+        servers = cls.from_data(yaml.load(raw, Loader=_Loader))
+
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                pickle.dump((digest, servers), f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Silently ignore errors - the cache is optional
+            pass
+
+        return servers
 
+    @classmethod
+    def from_data(cls, data: dict) -> list[MCPServerConfig]:
+        """Build MCP server configurations from parsed YAML data."""
         servers = []
         for server_data in data["servers"]:
             # Parse stdio config if present
@@ -91,3 +142,13 @@ class MCPServerConfig:
             servers.append(config)
 
         return servers
+
+
+# Field names of the cached config classes, part of the cache digest so that
+# adding, removing or renaming a field never loads a stale pickle
+_CACHE_SCHEMA = repr(
+    [
+        (cls.__name__, [field.name for field in fields(cls)])
+        for cls in (StdioConfig, SSEConfig, NamespaceMapping, MCPServerConfig)
+    ]
+).encode()
@@ -1,55 +1,70 @@
-import asyncio
 import sys
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from itertools import chain
+from typing import AsyncIterator
 
 from fastmcp import FastMCP
 
 from switchboard_mcp import utils
 from switchboard_mcp.config import MCPServerConfig
-from switchboard_mcp.session_manager import SessionManager
+from switchboard_mcp.session_manager import SessionManager, ToolGroup
 from switchboard_mcp.utils import Folder
 
 config = MCPServerConfig.from_yaml("switchboard.yaml")
-mcp = FastMCP("Switchboard MCP Server")
 
 
-async def setup_tools():
-    # Startup
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    # Keep the MCP sessions open for the whole life of the server, so tool
+    # calls reuse them instead of spawning the MCP servers again
     async with SessionManager(config) as manager:
         tool_groups = await manager.get_all_tools()
+        register_tools(server, tool_groups)
+        yield
 
-        def browse_tools(path: str) -> str:
-            root = Folder.from_tools(tool_groups)
-            return utils.browse_tools(root, path)
 
-        browse_tools_docs = f"""{utils.browse_tools.__doc__}
+mcp = FastMCP("Switchboard MCP Server", lifespan=lifespan)
+
+
+def register_tools(server: FastMCP, tool_groups: list[ToolGroup]) -> None:
+    # The tool groups are fixed for the life of the server, so the folder
+    # tree is built once and shared by every browse_tools call...
+    root = Folder.from_tools(tool_groups)
+    # ...and flattened once into the tool list used by every script
+    all_tools = list(chain.from_iterable(group.tools for group in tool_groups))
+
+    # Responses depend only on the path, so repeated queries (root, common
+    # namespaces) are answered from the cache
+    @lru_cache(maxsize=512)
+    def browse_path(path: str) -> str:
+        return utils.browse_tools(root, path)
+
+    def browse_tools(path: str) -> str:
+        return browse_path(path)
+
+    browse_tools_docs = f"""{utils.browse_tools.__doc__}
 
 Root modules:
 {browse_tools("")}
 """
 
-        async def execute_script(script: str) -> str:
-            async with SessionManager(config) as manager:
-                tool_groups = await manager.get_all_tools()
-                # Flatten tool groups to get all tools for script execution
-                all_tools = []
-                for group in tool_groups:
-                    all_tools.extend(group.tools)
-                return await utils.execute_script(all_tools, script)
-
-        mcp.tool(
-            browse_tools,
-            name="browse_tools",
-            description=browse_tools_docs,
-        )
-        mcp.tool(
-            execute_script,
-            name="execute_script",
-            description=utils.execute_script.__doc__,
-        )
+    async def execute_script(script: str) -> str:
+        return await utils.execute_script(all_tools, script)
+
+    server.tool(
+        browse_tools,
+        name="browse_tools",
+        description=browse_tools_docs,
+    )
+    server.tool(
+        execute_script,
+        name="execute_script",
+        description=utils.execute_script.__doc__,
+    )
 
 
 if __name__ == "__main__":
-    asyncio.run(setup_tools())
     # Parse command-line arguments for transport selection
     transport = "stdio"  # Default to stdio for compatibility
 
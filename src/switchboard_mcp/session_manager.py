@@ -1,4 +1,5 @@
 import asyncio
+import logging
 from dataclasses import dataclass
 from typing import Any, Callable, Coroutine, List, TypeVar
 
@@ -10,6 +11,8 @@ from switchboard_mcp.config import MCPServerConfig
 
 T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class ToolGroup:
@@ -40,17 +43,20 @@ def create_mcp_adapter(
     session: ClientSession, tool: mcp.Tool, loop: asyncio.AbstractEventLoop
 ) -> Callable[..., Any]:
     # Extract parameter names in order from the tool's schema
-    param_names = []
+    param_names: tuple[str, ...] = ()
     if hasattr(tool, "inputSchema") and tool.inputSchema:
-        properties = tool.inputSchema.get("properties", {})
-        param_names = list(properties.keys())
+        param_names = tuple(tool.inputSchema.get("properties", {}))
+    tool_name = tool.name
 
     def tool_adapter(*args: Any, **kwargs: Any) -> Any:
-        # Map positional arguments to parameter names
-        params = dict(zip(param_names, args))
-        # Merge with keyword arguments (kwargs take precedence)
-        params.update(kwargs)
-        return run_async_in_loop(session.call_tool(tool.name, params), loop)
+        if args:
+            # Map positional arguments to parameter names
+            params = dict(zip(param_names, args))
+            # Merge with keyword arguments (kwargs take precedence)
+            params.update(kwargs)
+        else:
+            params = kwargs
+        return run_async_in_loop(session.call_tool(tool_name, params), loop)
 
     return tool_adapter
 
@@ -58,9 +64,9 @@ def create_mcp_adapter(
 @dataclass
 class SessionHolder:
     session: ClientSession
-    session_cm: Any  # ClientSession context manager
-    stdio_cm: Any  # stdio_client context manager
     server_config: MCPServerConfig  # Configuration for this server
+    task: asyncio.Task[None]  # Task owning the session's context managers
+    stop: asyncio.Event  # Set to close the session
 
 
 class SessionManager:
@@ -74,49 +80,83 @@ class SessionManager:
         # Store the event loop for sync->async bridging
         self.loop = asyncio.get_running_loop()
 
+        stdio_configs = []
         for server_cfg in self.server_configs:
             if server_cfg.stdio:
-                server_params = StdioServerParameters(
-                    command=server_cfg.stdio.command,
-                    args=server_cfg.stdio.args,
-                    env=server_cfg.stdio.env,
-                )
-                # Create and store the stdio context manager
-                stdio_cm = stdio_client(server_params)
-                read, write = await stdio_cm.__aenter__()
-
-                # Create and store the session context manager
-                session_cm = ClientSession(read, write)
-                session = await session_cm.__aenter__()
-
-                # Initialize the session
-                await session.initialize()
-
-                # Store all components for cleanup
-                self.sessions.append(
-                    SessionHolder(session, session_cm, stdio_cm, server_cfg)
-                )
-
+                stdio_configs.append(server_cfg)
             elif server_cfg.sse:
                 raise NotImplementedError("SSE transport not implemented yet")
 
+        # Servers are independent, so spawn and initialize them concurrently
+        results = await asyncio.gather(
+            *(self._open_session(server_cfg) for server_cfg in stdio_configs),
+            return_exceptions=True,
+        )
+        self.sessions = [r for r in results if isinstance(r, SessionHolder)]
+
+        errors = [r for r in results if isinstance(r, BaseException)]
+        if errors:
+            # Close the sessions that did open before reporting the failure
+            await self.__aexit__(None, None, None)
+            raise errors[0]
+
         return self
 
+    async def _open_session(self, server_cfg: MCPServerConfig) -> SessionHolder:
+        """Open a session in its own task, which keeps it open until stopped.
+
+        The stdio and session context managers must be exited by the task
+        that entered them, so each session gets a task that owns them.
+        """
+        opened: asyncio.Future[ClientSession] = self.loop.create_future()
+        stop = asyncio.Event()
+        task = asyncio.create_task(self._run_session(server_cfg, opened, stop))
+        try:
+            session = await opened
+        except BaseException:
+            task.cancel()
+            raise
+        return SessionHolder(session, server_cfg, task, stop)
+
+    async def _run_session(
+        self,
+        server_cfg: MCPServerConfig,
+        opened: asyncio.Future[ClientSession],
+        stop: asyncio.Event,
+    ) -> None:
+        server_params = StdioServerParameters(
+            command=server_cfg.stdio.command,
+            args=server_cfg.stdio.args,
+            env=server_cfg.stdio.env,
+        )
+        try:
+            async with stdio_client(server_params) as (read, write):
+                async with ClientSession(read, write) as session:
+                    # Initialize the session
+                    await session.initialize()
+                    opened.set_result(session)
+                    await stop.wait()
+        except Exception as e:
+            if opened.done():
+                raise
+            opened.set_exception(e)
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Close all sessions, guaranteed to run even on exception"""
-        # Close in reverse order
-        for session_holder in reversed(self.sessions):
-            try:
-                # Close session first
-                await session_holder.session_cm.__aexit__(exc_type, exc_val, exc_tb)
-            except Exception as e:
-                print(f"Error closing session: {e}")
-
-            try:
-                # Close stdio connection
-                await session_holder.stdio_cm.__aexit__(exc_type, exc_val, exc_tb)
-            except Exception as e:
-                print(f"Error closing stdio: {e}")
+        for session_holder in self.sessions:
+            session_holder.stop.set()
+
+        results = await asyncio.gather(
+            *(session_holder.task for session_holder in self.sessions),
+            return_exceptions=True,
+        )
+        for session_holder, result in zip(self.sessions, results):
+            if isinstance(result, BaseException):
+                logger.warning(
+                    "Error closing session %s: %s",
+                    session_holder.server_config.name,
+                    result,
+                )
 
         self.sessions.clear()
         return False  # Don't suppress exceptions
@@ -128,10 +168,14 @@ class SessionManager:
                 "SessionManager must be entered as context manager first"
             )
 
+        # Servers are independent, so list their tools concurrently
+        tools_lists = await asyncio.gather(
+            *(session_holder.session.list_tools() for session_holder in self.sessions)
+        )
+
         tool_groups = []
 
-        for session_holder in self.sessions:
-            tools_list = await session_holder.session.list_tools()
+        for session_holder, tools_list in zip(self.sessions, tools_lists):
             server_tools = []
             for mcp_tool in tools_list.tools:
                 server_tools.append(
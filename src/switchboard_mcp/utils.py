@@ -1,22 +1,50 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import inspect
+import logging
+import os
+import sys
+from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable
 
 from simple_script.interpreter import Interpreter
 from simple_script.tools import Tool
 
 if TYPE_CHECKING:
+    from switchboard_mcp.config import MCPServerConfig
     from switchboard_mcp.session_manager import ToolGroup
 
+logger = logging.getLogger(__name__)
+
+# Worker threads for execute_script, shared by all calls. Scripts mostly
+# wait on MCP tool calls, so the pool is sized for I/O, not for CPUs
+_SCRIPT_EXECUTOR = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 1) + 4), thread_name_prefix="mcp-script"
+)
+atexit.register(_SCRIPT_EXECUTOR.shutdown)
+
 
 @dataclass
 class Folder:
     name: str
     folders: list["Folder"]
     tools: list[Tool]
+    # Index of `folders` by name, built from `folders` and kept in sync
+    # by _add_tools_to_path
+    folders_by_name: dict[str, "Folder"] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Reversed so that the first folder wins for duplicate names
+        self.folders_by_name = {folder.name: folder for folder in reversed(self.folders)}
 
     @classmethod
     def from_tools(cls, tool_groups: list[ToolGroup]) -> Folder:
@@ -27,16 +55,48 @@ class Folder:
         - Tools matching a module mapping pattern are placed under: server_name.module.remaining
           Patterns support: name* (prefix), *name (suffix), *name* (contains)
         - Tools not matching any mapping are placed under: server_name.tool_name
+
+        Folder trees are cached for recently seen tool groups, so repeated
+        calls with the same tools return the same (read-only) tree.
         """
+        key = _tool_groups_key(tool_groups)
+        cached = _FOLDER_CACHE.get(key)
+        if cached is not None:
+            return cached[1]
+
+        root = cls._build(tool_groups)
+
+        if len(_FOLDER_CACHE) >= _FOLDER_CACHE_SIZE:
+            # Evict the oldest entry
+            _FOLDER_CACHE.pop(next(iter(_FOLDER_CACHE)), None)
+        # Keep the tools alive so the ids in the key stay unique
+        tools = tuple(tool for group in tool_groups for tool in group.tools)
+        _FOLDER_CACHE[key] = (tools, root)
+        return root
+
+    @classmethod
+    def _build(cls, tool_groups: list[ToolGroup]) -> Folder:
+        """Build the folder tree without consulting the cache."""
         root = cls(name="", folders=[], tools=[])
+        # Tools grouped by destination folder path, so each path is walked
+        # once; dicts keep insertion order, so folders are created in the
+        # order their first tool appears
+        tools_by_path: dict[tuple[str, ...], list[Tool]] = {}
 
         for tool_group in tool_groups:
-            server_name = tool_group.server_config.name
+            # Folder names are interned, as they are shared by many folders
+            # and used as folders_by_name keys
+            server_name = sys.intern(tool_group.server_config.name)
             remove_prefix = tool_group.server_config.remove_prefix
+            # Resolve each mapping's folder path once per group, not per tool
+            exact_paths, wildcard_paths = _compile_mappings(
+                server_name, _mappings_key(tool_group.server_config)
+            )
+            server_path = (server_name,)
 
             for tool in tool_group.tools:
                 # Handle builtins - always add directly to root
-                if tool.name.startswith("builtins_"):
+                if _classify_tool_name(tool.name)[0]:
                     root.tools.append(tool)
                     continue
 
@@ -54,34 +114,46 @@ class Folder:
                     )
 
                 # Try to apply module mappings
-                mapped = False
-                if tool_group.server_config.namespace_mappings:
-                    for mapping in tool_group.server_config.namespace_mappings:
-                        # Try each pattern in the mapping
-                        # Use original tool name for pattern matching
-                        for pattern in mapping.tools:
-                            if _match_pattern(tool.name, pattern):
-                                # Split module by dots to create folder hierarchy
-                                namespace_parts = mapping.namespace.split(".")
-                                # Prepend server name to module path
-                                full_path = [server_name] + namespace_parts
-
-                                # Navigate/create folder hierarchy and add tool (with prefix removed if configured)
-                                _add_tool_to_path(root, full_path, tool_to_add)
-                                mapped = True
-                                break
-
-                        if mapped:
-                            break
+                # Use original tool name for pattern matching
+                full_path = _find_mapping_path(tool.name, exact_paths, wildcard_paths)
 
                 # If no mapping matched, add directly to server folder
-                if not mapped:
-                    full_path = [server_name]
-                    _add_tool_to_path(root, full_path, tool_to_add)
+                if full_path is None:
+                    full_path = server_path
+
+                # Add tool (with prefix removed if configured) under its folder path
+                tools_by_path.setdefault(full_path, []).append(tool_to_add)
+
+        # Navigate/create folder hierarchy for each path and add its tools
+        for full_path, tools in tools_by_path.items():
+            _add_tools_to_path(root, full_path, tools)
 
         return root
 
 
+# Folder trees built by Folder.from_tools, keyed by _tool_groups_key
+_FOLDER_CACHE: dict[tuple, tuple[tuple[Tool, ...], Folder]] = {}
+_FOLDER_CACHE_SIZE = 8
+
+
+def _tool_groups_key(tool_groups: list[ToolGroup]) -> tuple:
+    """Fingerprint everything Folder.from_tools reads from the tool groups."""
+    key = []
+    for tool_group in tool_groups:
+        config = tool_group.server_config
+        tools = tuple((id(tool), tool.name) for tool in tool_group.tools)
+        key.append((config.name, config.remove_prefix, _mappings_key(config), tools))
+    return tuple(key)
+
+
+def _mappings_key(config: MCPServerConfig) -> tuple[tuple[tuple[str, ...], str], ...]:
+    """Return a server's namespace mappings as hashable (patterns, namespace) pairs."""
+    return tuple(
+        (tuple(mapping.tools), mapping.namespace)
+        for mapping in config.namespace_mappings or ()
+    )
+
+
 def _match_pattern(tool_name: str, pattern: str) -> bool:
     """Match a tool name against a glob-like pattern.
 
@@ -97,60 +169,135 @@ def _match_pattern(tool_name: str, pattern: str) -> bool:
     Returns:
         True if the pattern matches, False otherwise
     """
+    return _match_compiled(tool_name, _compile_pattern(pattern))
+
+
+# Pattern kinds produced by _compile_pattern
+_NEVER = -1
+_EXACT = 0
+_PREFIX = 1
+_SUFFIX = 2
+_CONTAINS = 3
+
+
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> tuple[int, str]:
+    """Compile a glob-like pattern into a (kind, needle) pair.
+
+    The pattern is parsed once, so matching a compiled pattern is a single
+    string comparison, startswith, endswith or containment test.
+    """
     if "*" not in pattern:
-        # Exact match (no wildcard)
-        return tool_name == pattern
+        # Exact match (no wildcard); interned, like MCP tool names, so that
+        # comparing against a matching name is an identity check
+        return (_EXACT, sys.intern(pattern))
 
     # Count wildcards
     wildcard_count = pattern.count("*")
     if wildcard_count > 2:
-        return False
+        return (_NEVER, "")
 
     # Handle different pattern types
     if pattern.startswith("*") and pattern.endswith("*"):
         # *name* - contains pattern
         if wildcard_count != 2:
-            return False
-        search_str = pattern[1:-1]  # Remove both asterisks
-        return search_str in tool_name
+            return (_NEVER, "")
+        return (_CONTAINS, pattern[1:-1])  # Remove both asterisks
 
     elif pattern.startswith("*"):
         # *name - suffix pattern (tool ends with name)
-        suffix = pattern[1:]  # Remove asterisk
-        return tool_name.endswith(suffix)
+        return (_SUFFIX, pattern[1:])  # Remove asterisk
 
     elif pattern.endswith("*"):
         # name* - prefix pattern (tool starts with name)
-        prefix = pattern[:-1]  # Remove asterisk
-        return tool_name.startswith(prefix)
-
+        return (_PREFIX, pattern[:-1])  # Remove asterisk
+
+    return (_NEVER, "")
+
+
+def _match_compiled(tool_name: str, compiled: tuple[int, str]) -> bool:
+    """Match a tool name against a pattern compiled by _compile_pattern."""
+    kind, needle = compiled
+    if kind == _EXACT:
+        return tool_name == needle
+    if kind == _PREFIX:
+        return tool_name.startswith(needle)
+    if kind == _SUFFIX:
+        return tool_name.endswith(needle)
+    if kind == _CONTAINS:
+        return needle in tool_name
     return False
 
 
-def _add_tool_to_path(root: Folder, path: list[str], tool: Tool) -> None:
-    """Navigate/create folder hierarchy and add tool at the end.
+@lru_cache(maxsize=256)
+def _compile_mappings(
+    server_name: str, mappings: tuple[tuple[tuple[str, ...], str], ...]
+) -> tuple[
+    dict[str, tuple[int, tuple[str, ...]]],
+    list[tuple[int, tuple[int, str], tuple[str, ...]]],
+]:
+    """Compile a server's namespace mappings for matching tool names.
+
+    Exact patterns go into a dict from tool name to (mapping index, folder
+    path), so they cost a single lookup. Wildcard patterns are kept in
+    mapping order as (mapping index, compiled pattern, folder path).
+
+    Results are cached by the mappings' content (see _mappings_key), so
+    rebuilding the tree for the same configuration reuses them; callers
+    must not modify them.
+    """
+    exact_paths: dict[str, tuple[int, tuple[str, ...]]] = {}
+    wildcard_paths: list[tuple[int, tuple[int, str], tuple[str, ...]]] = []
+    for index, (patterns, namespace) in enumerate(mappings):
+        namespace_parts = (sys.intern(p) for p in namespace.split("."))
+        path = (server_name, *namespace_parts)
+        for pattern in patterns:
+            compiled = _compile_pattern(pattern)
+            if compiled[0] == _EXACT:
+                # Keep the first mapping listing this name
+                exact_paths.setdefault(compiled[1], (index, path))
+            elif compiled[0] != _NEVER:
+                wildcard_paths.append((index, compiled, path))
+    return exact_paths, wildcard_paths
+
+
+def _find_mapping_path(
+    tool_name: str,
+    exact_paths: dict[str, tuple[int, tuple[str, ...]]],
+    wildcard_paths: list[tuple[int, tuple[int, str], tuple[str, ...]]],
+) -> tuple[str, ...] | None:
+    """Return the folder path of the first mapping matching a tool name."""
+    best = exact_paths.get(tool_name)
+    for index, compiled, path in wildcard_paths:
+        if best is not None and index >= best[0]:
+            # Mappings are tried in order, so the exact match comes first
+            break
+        if _match_compiled(tool_name, compiled):
+            return path
+    return best[1] if best is not None else None
+
+
+def _add_tools_to_path(root: Folder, path: tuple[str, ...], tools: list[Tool]) -> None:
+    """Navigate/create folder hierarchy and add tools at the end.
 
     Args:
         root: The root folder to start from
-        path: List of folder names (e.g., ['server_name', 'module'])
-        tool: The tool to add (keeps its original full name)
+        path: Folder names (e.g., ('server_name', 'module'))
+        tools: The tools to add (they keep their original full names)
     """
-    if not path:
-        root.tools.append(tool)
-        return
-
     # Navigate/create all folders in the path
     current_folder = root
     for part in path:
         # Find or create subfolder
-        subfolder = next((f for f in current_folder.folders if f.name == part), None)
-        if not subfolder:
+        subfolder = current_folder.folders_by_name.get(part)
+        if subfolder is None:
             subfolder = Folder(name=part, folders=[], tools=[])
             current_folder.folders.append(subfolder)
+            current_folder.folders_by_name[part] = subfolder
         current_folder = subfolder
 
-    # Add the tool to the final folder (tool keeps its original name)
-    current_folder.tools.append(tool)
+    # Add the tools to the final folder (tools keep their original names)
+    current_folder.tools.extend(tools)
 
 
 def copy_doc(from_func):
@@ -171,52 +318,80 @@ def _format_function_description(tool: Tool) -> str:
     Returns:
         Formatted multi-line Python function definition string
     """
-    import inspect
-
+    _, function_name = _classify_tool_name(tool.name)
+    # Types render via str() anyway; stringify them so that list types
+    # such as ["string", "null"] can be part of the cache key
+    params = tuple(
+        (param.name, str(param.type) if param.type else None)
+        for param in tool.parameters or ()
+    )
+    return _render_function_description(
+        function_name, params, tool.func, tool.description
+    )
+
+
+@lru_cache(maxsize=4096)
+def _classify_tool_name(name: str) -> tuple[bool, str]:
+    """Return whether a tool name is a builtin, and its function name.
+
+    Cached by name, as each tool's name is classified on every tree build
+    and every listing of its folder.
+    """
     # Extract function name from the tool name
     # For builtins, strip the "builtins_" prefix
-    if tool.name.startswith("builtins_"):
-        function_name = tool.name[len("builtins_") :]
-    else:
-        # For regular tools, use last part after splitting by _
-        function_name = tool.name.split("_")[-1]
-
+    if name.startswith("builtins_"):
+        return True, name[len("builtins_") :]
+    # For regular tools, use last part after splitting by _
+    return False, name.rpartition("_")[2]
+
+
+@lru_cache(maxsize=4096)
+def _render_function_description(
+    function_name: str,
+    params: tuple[tuple[str, str | None], ...],
+    func: Callable[..., Any] | None,
+    description: str,
+) -> str:
+    """Render a function definition; cached as the inputs never change."""
     # Build parameter signature
-    if tool.parameters:
+    if params:
         param_strs = []
-        for param in tool.parameters:
-            if param.type:
-                param_strs.append(f"{param.name}: {param.type}")
+        for param_name, param_type in params:
+            if param_type:
+                param_strs.append(f"{param_name}: {param_type}")
             else:
-                param_strs.append(param.name)
+                param_strs.append(param_name)
         param_signature = f"({', '.join(param_strs)})"
     else:
         param_signature = "()"
 
     # Determine return type
-    return_type = "Any"
-    if tool.func:
-        try:
-            # Try to get return annotation from the function
-            sig = inspect.signature(tool.func)
-            if sig.return_annotation != inspect.Signature.empty:
-                # Get the string representation of the return type
-                return_annotation = sig.return_annotation
-                if hasattr(return_annotation, "__name__"):
-                    return_type = return_annotation.__name__
-                else:
-                    return_type = str(return_annotation).replace("typing.", "")
-        except Exception:
-            # If we can't inspect, default to Any
-            return_type = "Any"
+    return_type = _return_type_of(func) if func else "Any"
 
     # Format as Python function definition
-    lines = []
-    lines.append(f"def {function_name}{param_signature} -> {return_type}:")
-    lines.append(f'    """{tool.description}"""')
-    lines.append("    ...")
-
-    return "\n".join(lines)
+    return (
+        f"def {function_name}{param_signature} -> {return_type}:\n"
+        f'    """{description}"""\n'
+        "    ..."
+    )
+
+
+@lru_cache(maxsize=4096)
+def _return_type_of(func: Callable[..., Any]) -> str:
+    """Return the name of a function's return annotation, or 'Any'."""
+    try:
+        # Try to get return annotation from the function
+        sig = inspect.signature(func)
+        if sig.return_annotation != inspect.Signature.empty:
+            # Get the string representation of the return type
+            return_annotation = sig.return_annotation
+            if hasattr(return_annotation, "__name__"):
+                return return_annotation.__name__
+            return str(return_annotation).replace("typing.", "")
+    except Exception:
+        # If we can't inspect, default to Any
+        pass
+    return "Any"
 
 
 def _format_type_from_schema(schema: dict[str, Any], type_name: str) -> str:
@@ -230,12 +405,8 @@ def _format_type_from_schema(schema: dict[str, Any], type_name: str) -> str:
     Returns:
         Formatted TypedDict class definition string
     """
-    if schema.get("type") != "object":
-        # Not an object type, skip
-        return ""
-
-    properties = schema.get("properties", {})
-    if not properties:
+    if schema.get("type") != "object" or not (properties := schema.get("properties")):
+        # Not an object type or no properties, skip
         return ""
 
     required_fields = set(schema.get("required", []))
@@ -276,7 +447,7 @@ def _extract_nested_types(schema: dict[str, Any]) -> list[tuple[str, dict[str, A
 
     for prop_name, prop_schema in properties.items():
         # Capitalize property name for type name
-        type_name = prop_name[0].upper() + prop_name[1:] if prop_name else prop_name
+        type_name = prop_name[:1].upper() + prop_name[1:]
 
         if prop_schema.get("type") == "object":
             # Direct nested object property
@@ -292,6 +463,33 @@ def _extract_nested_types(schema: dict[str, Any]) -> list[tuple[str, dict[str, A
     return nested_types
 
 
+def _nested_type_defs(schema: dict[str, Any]) -> tuple[str, ...]:
+    """Return the TypedDict definitions of a schema's nested types, cached per schema."""
+    cached = _TYPE_DEFS_CACHE.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    # Extract nested types from the inputSchema (not the root itself)
+    type_defs = []
+    for type_name, type_schema in _extract_nested_types(schema):
+        type_def = _format_type_from_schema(type_schema, type_name)
+        if type_def:
+            type_defs.append(type_def)
+    result = tuple(type_defs)
+
+    if len(_TYPE_DEFS_CACHE) >= _TYPE_DEFS_CACHE_SIZE:
+        # Evict the oldest entry
+        _TYPE_DEFS_CACHE.pop(next(iter(_TYPE_DEFS_CACHE)), None)
+    # Keep the schema alive so its id stays unique while cached
+    _TYPE_DEFS_CACHE[id(schema)] = (schema, result)
+    return result
+
+
+# Type definitions rendered by _nested_type_defs, keyed by id of the schema
+_TYPE_DEFS_CACHE: dict[int, tuple[dict[str, Any], tuple[str, ...]]] = {}
+_TYPE_DEFS_CACHE_SIZE = 4096
+
+
 def _json_type_to_python(schema: dict[str, Any]) -> str:
     """
     Convert JSON Schema type to Python type annotation.
@@ -302,6 +500,29 @@ def _json_type_to_python(schema: dict[str, Any]) -> str:
     Returns:
         Python type string (e.g., 'str', 'int', 'list[str]', 'Literal["a", "b"]')
     """
+    cached = _JSON_TYPE_CACHE.get(id(schema))
+    if cached is not None and cached[0] is schema:
+        return cached[1]
+
+    result = _render_json_type(schema)
+
+    if len(_JSON_TYPE_CACHE) >= _JSON_TYPE_CACHE_SIZE:
+        # Evict the oldest entry
+        _JSON_TYPE_CACHE.pop(next(iter(_JSON_TYPE_CACHE)), None)
+    # Keep the schema alive so its id stays unique while cached
+    _JSON_TYPE_CACHE[id(schema)] = (schema, result)
+    return result
+
+
+# Annotations rendered by _json_type_to_python, keyed by id of the schema.
+# Keyed by identity rather than value, as equal-hashing values such as 1,
+# 1.0 and True must not share an annotation.
+_JSON_TYPE_CACHE: dict[int, tuple[dict[str, Any], str]] = {}
+_JSON_TYPE_CACHE_SIZE = 4096
+
+
+def _render_json_type(schema: dict[str, Any]) -> str:
+    """Convert a JSON Schema to a Python type annotation without caching."""
     json_type = schema.get("type")
 
     # Handle enum as Literal
@@ -335,11 +556,9 @@ def _json_type_to_python(schema: dict[str, Any]) -> str:
     return "Any"
 
 
-def _collect_all_tools_recursive(
-    folder: Folder, current_path: str
-) -> list[tuple[str, Tool]]:
+def _collect_all_tools(folder: Folder, current_path: str) -> list[tuple[str, Tool]]:
     """
-    Recursively collect all tools from a folder and its subfolders.
+    Collect all tools from a folder and its subfolders, depth first.
 
     Args:
         folder: The folder to collect tools from
@@ -350,20 +569,35 @@ def _collect_all_tools_recursive(
     """
     results = []
 
-    # Add tools from current folder
-    for tool in folder.tools:
-        results.append((current_path, tool))
+    # Walk with an explicit stack; subfolders are pushed in reverse so they
+    # are visited in order
+    stack = [(folder, current_path)]
+    while stack:
+        folder, current_path = stack.pop()
 
-    # Recursively collect from subfolders
-    for subfolder in folder.folders:
-        subfolder_path = (
-            f"{current_path}.{subfolder.name}" if current_path else subfolder.name
-        )
-        results.extend(_collect_all_tools_recursive(subfolder, subfolder_path))
+        # Add tools from current folder
+        for tool in folder.tools:
+            results.append((current_path, tool))
+
+        for subfolder in reversed(folder.folders):
+            subfolder_path = (
+                f"{current_path}.{subfolder.name}" if current_path else subfolder.name
+            )
+            stack.append((subfolder, subfolder_path))
 
     return results
 
 
+@lru_cache(maxsize=4096)
+def _indented(text: str) -> str:
+    """Indent each line of a rendered definition for a browse_tools listing.
+
+    Rendered definitions come from caches, so the same strings are indented
+    again and again; caching the result makes repeats a dict lookup.
+    """
+    return "  " + text.replace("\n", "\n  ")
+
+
 def browse_tools(root: Folder, path: str = "") -> str:
     """
     Browse MCP tools organized in a hierarchical structure using dot notation.
@@ -391,22 +625,22 @@ def browse_tools(root: Folder, path: str = "") -> str:
             base_path = ""
         else:
             base_path = path[:-2]
-        parts = [i for i in base_path.split(".") if i != ""]
+        parts = filter(None, base_path.split("."))
     else:
-        parts = [i for i in path.split(".") if i != ""]
+        parts = filter(None, path.split("."))
 
     current_folder = root
 
     for part in parts:
-        folder = next((f for f in current_folder.folders if f.name == part), None)
-        if not folder:
+        folder = current_folder.folders_by_name.get(part)
+        if folder is None:
             return f"Path '{path}' not found."
         current_folder = folder
 
     # If wildcard, collect all tools recursively
     if is_wildcard:
         # base_path was already computed above
-        all_tools = _collect_all_tools_recursive(current_folder, base_path)
+        all_tools = _collect_all_tools(current_folder, base_path)
 
         if not all_tools:
             display_path = "*" if path == "*" else f"{base_path}/*"
@@ -420,19 +654,15 @@ def browse_tools(root: Folder, path: str = "") -> str:
         result_parts.append("")
 
         # Group tools by their path
-        from collections import defaultdict
-
-        tools_by_path = defaultdict(list)
+        tools_by_path: dict[str, list[Tool]] = {}
         for tool_path, tool in all_tools:
-            tools_by_path[tool_path].append(tool)
+            tools_by_path.setdefault(tool_path, []).append(tool)
 
         # Sort paths for consistent output
         for tool_path in sorted(tools_by_path.keys()):
             result_parts.append(f"# {tool_path}")
             for tool in tools_by_path[tool_path]:
-                func_def = _format_function_description(tool)
-                indented = "\n".join(f"  {line}" for line in func_def.split("\n"))
-                result_parts.append(indented)
+                result_parts.append(_indented(_format_function_description(tool)))
             result_parts.append("")
 
         return "\n".join(result_parts)
@@ -466,21 +696,14 @@ def browse_tools(root: Folder, path: str = "") -> str:
     types_to_show = []
     for tool in current_folder.tools:
         if tool.inputSchema:
-            # Extract nested types from the inputSchema (not the root itself)
-            nested_types = _extract_nested_types(tool.inputSchema)
-            for type_name, type_schema in nested_types:
-                type_def = _format_type_from_schema(type_schema, type_name)
-                if type_def:
-                    types_to_show.append(type_def)
+            types_to_show.extend(_nested_type_defs(tool.inputSchema))
 
     if types_to_show:
         if result_parts:
             result_parts.append("")  # Empty line separator
         result_parts.append("Types:")
-        for type_def in types_to_show:
-            # Indent each line of the type definition
-            indented = "\n".join(f"  {line}" for line in type_def.split("\n"))
-            result_parts.append(indented)
+        # Indent each line of the type definitions
+        result_parts.extend(map(_indented, types_to_show))
 
     # 3. Show functions
     if current_folder.tools:
@@ -489,30 +712,49 @@ def browse_tools(root: Folder, path: str = "") -> str:
         result_parts.append("Functions:")
         for tool in current_folder.tools:
             # Indent each line of the function definition
-            func_def = _format_function_description(tool)
-            indented = "\n".join(f"  {line}" for line in func_def.split("\n"))
-            result_parts.append(indented)
+            result_parts.append(_indented(_format_function_description(tool)))
 
     return "\n".join(result_parts) if result_parts else "No entries found."
 
 
+# Output collected by builtins_print for the script currently being executed
+_script_prints: ContextVar[list[str]] = ContextVar("_script_prints")
+
+
+def builtins_print(*args: Any) -> None:
+    """Print all arguments."""
+    output = " ".join(map(str, args))
+    _script_prints.get().append(output)
+
+
+# Shared by every script, so the interpreter sees the same tools on each call
+PRINT_TOOL = Tool.from_function(builtins_print)
+
+
+@contextmanager
+def collect_script_prints() -> Iterator[list[str]]:
+    """Collect what PRINT_TOOL prints in the current context into a list."""
+    prints: list[str] = []
+    token = _script_prints.set(prints)
+    try:
+        yield prints
+    finally:
+        _script_prints.reset(token)
+
+
 def _execute_script_sync(tools: list[Tool], script: str) -> str:
     """Synchronous script execution - runs in a separate thread."""
-    print("execute_script -------------------------- START")
-    print(script)
-    prints = []
-
-    def builtins_print(*args: Any) -> None:
-        """Print all arguments."""
-        output = " ".join(str(arg) for arg in args)
-        prints.append(output)
-
-    interpreter = Interpreter(tools=[*tools, Tool.from_function(builtins_print)])
-    _ = interpreter.evaluate(script)
-    print("execute_script -------------------------- END")
+    # Checked once per script; a disabled logger then costs nothing more
+    debug = logger.isEnabledFor(logging.DEBUG)
+    if debug:
+        logger.debug("execute_script start:\n%s", script)
+
+    with collect_script_prints() as prints:
+        interpreter = Interpreter(tools=[*tools, PRINT_TOOL])
+        _ = interpreter.evaluate(script)
     result = "\n".join(prints)
-    print(result)
-    print("")
+    if debug:
+        logger.debug("execute_script end:\n%s", result)
     return result
 
 
@@ -557,10 +799,7 @@ async def execute_script(tools: list[Tool], script: str) -> str:
     """
     # Run the script in a separate thread so that tools can use
     # asyncio.run_coroutine_threadsafe to call back to this event loop
-    print("------------ execute_script: ", script)
     loop = asyncio.get_running_loop()
-    with ThreadPoolExecutor() as executor:
-        result = await loop.run_in_executor(
-            executor, _execute_script_sync, tools, script
-        )
-    return result
+    return await loop.run_in_executor(
+        _SCRIPT_EXECUTOR, _execute_script_sync, tools, script
+    )
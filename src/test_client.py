@@ -19,18 +19,82 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import os
 import sys
+import tempfile
+from functools import cached_property
 from pathlib import Path
 from typing import Any
 
+import httpx
+from mcp import ClientSession, StdioServerParameters
+from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+from mcp.types import CallToolResult, TextContent
+
 try:
     import readline
 except ImportError:
     readline = None  # type: ignore
 
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
-from mcp.client.streamable_http import streamablehttp_client
+
+# Above this many entries, loading history from a temp file in one
+# read_history_file call beats per-entry add_history. libedit uses a
+# different history file format, so it always takes the per-entry path.
+HISTORY_BATCH_THRESHOLD = 256
+_CAN_BATCH_HISTORY = readline is not None and "libedit" not in (readline.__doc__ or "")
+
+# Keep the HTTP connection alive across REPL pauses between tool calls;
+# httpx drops idle connections after 5 seconds by default.
+HTTP_KEEPALIVE_LIMITS = httpx.Limits(max_keepalive_connections=8, keepalive_expiry=30.0)
+
+
+def _create_keepalive_http_client(
+    headers: dict[str, str] | None = None,
+    timeout: httpx.Timeout | None = None,
+    auth: httpx.Auth | None = None,
+) -> httpx.AsyncClient:
+    """Create the streamable-http client with MCP defaults and longer keep-alive."""
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout if timeout is not None else httpx.Timeout(30.0),
+        auth=auth,
+        follow_redirects=True,
+        limits=HTTP_KEEPALIVE_LIMITS,
+    )
+
+
+def _print_result(result: CallToolResult) -> None:
+    """Print the text parts of a tool result in a single write."""
+    text = "\n".join(
+        content.text for content in result.content if isinstance(content, TextContent)
+    )
+    print(f"\nResult:\n{text}")
+
+
+def _replace_history(items: list[str]) -> None:
+    """Replace the readline history with the given entries.
+
+    Empty entries are skipped, as they are not useful to recall and a
+    history file cannot hold them. Large lists are loaded through a
+    temporary history file.
+    """
+    items = [item for item in items if item]
+    readline.clear_history()
+    if not _CAN_BATCH_HISTORY or len(items) < HISTORY_BATCH_THRESHOLD:
+        for item in items:
+            readline.add_history(item)
+        return
+
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", suffix=".history", delete=False
+    ) as f:
+        f.write("\n".join(items))
+        f.write("\n")
+    try:
+        readline.read_history_file(f.name)
+    finally:
+        os.unlink(f.name)
 
 
 class MCPTestClient:
@@ -39,6 +103,9 @@ class MCPTestClient:
     # History file location in user's home directory
     HISTORY_FILE = Path.home() / ".mcp_test_client_history"
 
+    # Upper bound on readline entries kept across execute commands
+    MAX_HISTORY_LENGTH = 5000
+
     def __init__(
         self,
         transport: str = "stdio",
@@ -52,28 +119,146 @@ class MCPTestClient:
         self.stdio_context = None
         self.http_context = None
         self.session_context = None
-        self.last_script: str = ""
+        self._saved_history: list[str] | None = None
+        self._stdin_reader: asyncio.StreamReader | None = None
+        self._stdin_checked = False
+        self._tools_task: asyncio.Task | None = None
 
-        # Load last script from disk
-        self._load_last_script()
+        if readline:
+            readline.set_history_length(self.MAX_HISTORY_LENGTH)
 
-    def _load_last_script(self) -> None:
-        """Load the last executed script from disk."""
+    @cached_property
+    def _persisted_script(self) -> str:
+        """Script stored in the history file, read from disk on first use."""
         try:
-            if self.HISTORY_FILE.exists():
-                self.last_script = self.HISTORY_FILE.read_text(encoding="utf-8")
+            return self.HISTORY_FILE.read_text(encoding="utf-8")
         except Exception:
             # Silently ignore errors - history is optional
-            pass
+            return ""
+
+    @cached_property
+    def last_script(self) -> str:
+        """Last executed script, defaulting to the one saved on disk."""
+        return self._persisted_script
+
+    def _has_last_script(self) -> bool:
+        """Check for a last script without reading the history file."""
+        if "last_script" in self.__dict__:
+            return bool(self.last_script)
+        try:
+            return self.HISTORY_FILE.stat().st_size > 0
+        except OSError:
+            return False
 
     def _save_last_script(self) -> None:
-        """Save the last executed script to disk."""
+        """Save the last executed script to disk unless it is already there."""
+        if self.last_script == self._persisted_script:
+            return
         try:
             self.HISTORY_FILE.write_text(self.last_script, encoding="utf-8")
+            self._persisted_script = self.last_script
         except Exception:
             # Silently ignore errors - history is optional
             pass
 
+    def _snapshot_history(self) -> None:
+        """Bring the cached readline history snapshot up to date.
+
+        After a restore readline holds exactly the snapshot from index 1, so
+        only entries added since the last ``execute`` need to be read back.
+        When readline has dropped or replaced entries since, e.g. a history
+        stifled at capacity, the positions no longer line up and the whole
+        history is read again.
+        """
+        hist_len = readline.get_current_history_length()
+        saved = self._saved_history
+        if not saved or hist_len < len(saved) or readline.get_history_item(1) != saved[0]:
+            saved = self._saved_history = []
+        start = len(saved)
+        if hist_len == start:
+            return
+
+        # Entries dropped by a stifled history leave the lowest indexes empty
+        offset = 0
+        if not saved:
+            while readline.get_history_item(offset + 1) is None:
+                offset += 1
+                if offset > hist_len + self.MAX_HISTORY_LENGTH:
+                    return
+
+        if hist_len - start > self.MAX_HISTORY_LENGTH:
+            saved.clear()
+            start = hist_len - self.MAX_HISTORY_LENGTH
+        for i in range(offset + start + 1, offset + hist_len + 1):
+            item = readline.get_history_item(i)
+            if item:
+                saved.append(item)
+        del saved[: -self.MAX_HISTORY_LENGTH]
+
+    async def _get_stdin_reader(self) -> asyncio.StreamReader | None:
+        """Attach a StreamReader to stdin when it is a pipe.
+
+        Returns None for a terminal (readline recall needs ``input()``) or
+        when stdin cannot be attached to the event loop, e.g. a regular file.
+        """
+        if not self._stdin_checked:
+            self._stdin_checked = True
+            if not sys.stdin.isatty():
+                loop = asyncio.get_running_loop()
+                reader = asyncio.StreamReader()
+                try:
+                    await loop.connect_read_pipe(
+                        lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+                    )
+                except (OSError, ValueError):
+                    pass
+                else:
+                    self._stdin_reader = reader
+        return self._stdin_reader
+
+    async def _input(self, prompt: str = "", use_readline: bool = True) -> str:
+        """Read one line from stdin without blocking the event loop if possible.
+
+        With ``use_readline=False`` a terminal is read directly, bypassing
+        readline line editing.
+        """
+        reader = await self._get_stdin_reader()
+        if reader is None and use_readline:
+            return input(prompt)
+
+        if prompt:
+            print(prompt, end="", flush=True)
+        if reader is None:
+            line = sys.stdin.readline()
+            if not line:
+                raise EOFError
+            return line.rstrip("\n")
+        line = await reader.readline()
+        if not line:
+            raise EOFError
+        return line.decode("utf-8").rstrip("\n")
+
+    async def _read_script_lines(self, use_readline: bool = True) -> list[str]:
+        """Read script lines until two consecutive empty lines or EOF."""
+        lines = []
+        empty_line_count = 0
+
+        while True:
+            try:
+                line = await self._input(use_readline=use_readline)
+            except EOFError:
+                break
+
+            if line == "":
+                empty_line_count += 1
+                if empty_line_count >= 2:
+                    break
+            else:
+                empty_line_count = 0
+            lines.append(line)
+
+        return lines
+
     async def connect(self) -> None:
         """Connect to the MCP server."""
         print(f"Connecting to MCP server via {self.transport}...")
@@ -94,7 +279,9 @@ class MCPTestClient:
         elif self.transport == "http":
             # Connect to existing HTTP server using streamable-http transport
             url = f"http://{self.host}:{self.port}/mcp"
-            self.http_context = streamablehttp_client(url)
+            self.http_context = streamablehttp_client(
+                url, httpx_client_factory=_create_keepalive_http_client
+            )
             read, write, _get_session_id = await self.http_context.__aenter__()
 
             self.session_context = ClientSession(read, write)
@@ -104,10 +291,15 @@ class MCPTestClient:
 
         # Initialize the session
         await self.session.initialize()
+        # Servers reject requests until initialization completes, so the
+        # tool listing is prefetched right after it rather than alongside
+        self._tools_task = asyncio.create_task(self.session.list_tools())
         print("Connected successfully!\n")
 
     async def disconnect(self) -> None:
         """Disconnect from the MCP server."""
+        if self._tools_task and not self._tools_task.done():
+            self._tools_task.cancel()
         if self.session_context:
             await self.session_context.__aexit__(None, None, None)
         if self.stdio_context:
@@ -125,7 +317,12 @@ class MCPTestClient:
         print("Available tools:")
         print("-" * 80)
 
-        tools_result = await self.session.list_tools()
+        if self._tools_task:
+            # Consume the listing prefetched by connect()
+            tools_task, self._tools_task = self._tools_task, None
+            tools_result = await tools_task
+        else:
+            tools_result = await self.session.list_tools()
 
         if not tools_result.tools:
             print("No tools available.")
@@ -177,7 +374,7 @@ class MCPTestClient:
         print("\n" + "=" * 80 + "\n")
 
         # Show history status
-        if self.last_script:
+        if self._has_last_script():
             print(f"📝 Script history loaded from {self.HISTORY_FILE}")
             print("   Use 'execute' and arrow-up to recall\n")
 
@@ -186,7 +383,7 @@ class MCPTestClient:
 
         while True:
             try:
-                user_input = input("\n> ").strip()
+                user_input = (await self._input("\n> ")).strip()
 
                 if not user_input:
                     continue
@@ -224,20 +421,14 @@ class MCPTestClient:
                         "execute_script", {"script": self.last_script}
                     )
                     if result:
-                        print("\nResult:")
-                        for content in result.content:
-                            if hasattr(content, "text"):
-                                print(content.text)
+                        _print_result(result)
 
                 elif command == "browse":
                     path = args.strip()
                     print(f"\nBrowsing path: '{path}'")
                     result = await self.call_tool("browse_tools", {"path": path})
                     if result:
-                        print("\nResult:")
-                        for content in result.content:
-                            if hasattr(content, "text"):
-                                print(content.text)
+                        _print_result(result)
 
                 elif command == "execute":
                     # Multi-line script input mode
@@ -246,48 +437,26 @@ class MCPTestClient:
                         print("(Tip: Arrow-up to recall previous script)")
 
                     # Save current readline history and set up script history
-                    saved_history = []
                     if readline:
-                        # Save current history
-                        hist_len = readline.get_current_history_length()
-                        for i in range(1, hist_len + 1):
-                            saved_history.append(readline.get_history_item(i))
+                        self._snapshot_history()
 
                         # Clear history and add last script lines in REVERSE order
                         # This way arrow-up shows line 1 first, then line 2, etc.
-                        readline.clear_history()
-                        if self.last_script:
-                            script_lines = self.last_script.split("\n")
-                            for line in reversed(script_lines):
-                                readline.add_history(line)
+                        _replace_history(self.last_script.splitlines()[::-1])
 
-                    lines = []
-                    empty_line_count = 0
+                        # Script lines are dropped from history afterwards
+                        readline.set_auto_history(False)
 
                     try:
-                        while True:
-                            try:
-                                line = input()
-
-                                if line == "":
-                                    empty_line_count += 1
-                                    if empty_line_count >= 2:
-                                        break
-                                    lines.append(line)
-                                else:
-                                    empty_line_count = 0
-                                    lines.append(line)
-
-                            except EOFError:
-                                break
-
+                        # Without a script to recall, readline only slows down pasting
+                        lines = await self._read_script_lines(
+                            use_readline=bool(self.last_script)
+                        )
                     finally:
                         # Restore original history
                         if readline:
-                            readline.clear_history()
-                            for hist_item in saved_history:
-                                if hist_item:
-                                    readline.add_history(hist_item)
+                            readline.set_auto_history(True)
+                            _replace_history(self._saved_history)
 
                     # Remove trailing empty lines
                     while lines and lines[-1] == "":
@@ -304,10 +473,7 @@ class MCPTestClient:
                     print("\nExecuting script...")
                     result = await self.call_tool("execute_script", {"script": script})
                     if result:
-                        print("\nResult:")
-                        for content in result.content:
-                            if hasattr(content, "text"):
-                                print(content.text)
+                        _print_result(result)
 
                 else:
                     print(f"Unknown command: {command}")
@@ -0,0 +1,97 @@
+"""Unit tests for loading server configurations from YAML."""
+
+import pytest
+
+from switchboard_mcp import config
+from switchboard_mcp.config import MCPServerConfig, NamespaceMapping, StdioConfig
+
+CONFIG_YAML = """servers:
+  - name: calc
+    stdio:
+      command: python
+      args: ["calc.py"]
+    namespace_mappings:
+      - tools: ["math_*"]
+        namespace: math
+"""
+
+EXPECTED = [
+    MCPServerConfig(
+        name="calc",
+        stdio=StdioConfig(command="python", args=["calc.py"]),
+        namespace_mappings=[NamespaceMapping(tools=["math_*"], namespace="math")],
+    )
+]
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    path = tmp_path / "switchboard.yaml"
+    path.write_text(CONFIG_YAML, encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    path = tmp_path / "cache"
+    monkeypatch.setattr(config, "CACHE_DIR", path)
+    return path
+
+
+def fail_yaml_load(*args, **kwargs):
+    raise AssertionError("YAML should not be parsed on a cache hit")
+
+
+class TestFromYamlCache:
+    """Test suite for the on-disk cache of MCPServerConfig.from_yaml."""
+
+    def test_miss_parses_and_writes_cache(self, config_path, cache_dir):
+        """Test that the first load parses the YAML and writes one cache file."""
+        assert MCPServerConfig.from_yaml(str(config_path)) == EXPECTED
+        assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+    def test_hit_skips_parsing(self, config_path, cache_dir, monkeypatch):
+        """Test that an unchanged file is loaded from the cache."""
+        MCPServerConfig.from_yaml(str(config_path))
+        monkeypatch.setattr(config.yaml, "load", fail_yaml_load)
+
+        assert MCPServerConfig.from_yaml(str(config_path)) == EXPECTED
+
+    def test_changed_content_replaces_cache(self, config_path, cache_dir):
+        """Test that editing the file reparses it and keeps a single cache file."""
+        MCPServerConfig.from_yaml(str(config_path))
+        config_path.write_text(CONFIG_YAML.replace("calc.py", "calc2.py"), encoding="utf-8")
+
+        servers = MCPServerConfig.from_yaml(str(config_path))
+
+        assert servers[0].stdio.args == ["calc2.py"]
+        assert len(list(cache_dir.glob("*.pkl"))) == 1
+
+    def test_changed_config_fields_miss(self, config_path, cache_dir, monkeypatch):
+        """Test that a change of the config classes' fields ignores old pickles."""
+        MCPServerConfig.from_yaml(str(config_path))
+        monkeypatch.setattr(config, "_CACHE_SCHEMA", b"changed")
+        calls = []
+        load = config.yaml.load
+        monkeypatch.setattr(config.yaml, "load", lambda *a, **kw: calls.append(1) or load(*a, **kw))
+
+        assert MCPServerConfig.from_yaml(str(config_path)) == EXPECTED
+        assert calls == [1]
+
+    def test_corrupt_cache_is_ignored(self, config_path, cache_dir):
+        """Test that an unreadable cache file falls back to parsing and is rewritten."""
+        MCPServerConfig.from_yaml(str(config_path))
+        (cache_file,) = cache_dir.glob("*.pkl")
+        cache_file.write_bytes(b"not a pickle")
+
+        assert MCPServerConfig.from_yaml(str(config_path)) == EXPECTED
+        assert cache_file.read_bytes() != b"not a pickle"
+
+    def test_unwritable_cache_dir_is_ignored(self, config_path, tmp_path, monkeypatch):
+        """Test that loading works when the cache directory cannot be created."""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("", encoding="utf-8")
+        monkeypatch.setattr(config, "CACHE_DIR", blocker / "cache")
+
+        assert MCPServerConfig.from_yaml(str(config_path)) == EXPECTED
+        assert MCPServerConfig.from_yaml(str(config_path)) == EXPECTED
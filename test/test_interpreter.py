@@ -1,4 +1,8 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
+from mcp.types import Tool as McpTool
+
 from src.simple_script import Interpreter, Tool
 
 
@@ -25,26 +29,9 @@ x"""
     assert result == 10
 
 
-def test_interpreter_calls_tool_function():
-    """Test calling a tool function"""
-    def add_func(x: float, y: float) -> float:
-        """Add two numbers."""
-        return x + y
-
-    add_tool = Tool.from_function(add_func)
-    add_tool.name = "math_operations_plus"
-
-    interpreter = Interpreter([add_tool])
-    script = """from math.operations import plus
-result = plus(5, 3)
-result"""
-
-    result = interpreter.evaluate(script)
-    assert result == 8
-
-
-def test_interpreter_calls_multiple_tools():
-    """Test calling multiple tool functions"""
+@pytest.fixture(scope="module")
+def math_tools():
+    """Math tools shared by the tool-call tests"""
     def add_func(x: float, y: float) -> float:
         """Add two numbers."""
         return x + y
@@ -53,38 +40,66 @@ def test_interpreter_calls_multiple_tools():
         """Multiply two numbers."""
         return x * y
 
-    add_tool = Tool.from_function(add_func)
-    add_tool.name = "math_operations_plus"
-
-    multiply_tool = Tool.from_function(multiply_func)
-    multiply_tool.name = "math_operations_multiply"
-
-    interpreter = Interpreter([add_tool, multiply_tool])
-    script = """from math.operations import plus, multiply
-result = plus(5, 3)
-result2 = multiply(result, 2)
-result2"""
-
-    result = interpreter.evaluate(script)
-    assert result == 16
-
-
-def test_interpreter_with_statistics_min():
-    """Test calling min function from statistics"""
     def min_func(numbers: list[float]) -> float:
         """Find minimum."""
         return min(numbers)
 
-    min_tool = Tool.from_function(min_func)
-    min_tool.name = "math_statistics_min"
+    def avg_func(numbers: list[float]) -> float:
+        """Calculate average."""
+        return sum(numbers) / len(numbers)
 
-    interpreter = Interpreter([min_tool])
-    script = """from math.statistics import min
+    tools = []
+    for func, name in [
+        (add_func, "math_operations_plus"),
+        (multiply_func, "math_operations_multiply"),
+        (min_func, "math_statistics_min"),
+        (avg_func, "math_statistics_average"),
+    ]:
+        tool = Tool.from_function(func)
+        tool.name = name
+        tools.append(tool)
+    return tools
+
+
+@pytest.mark.parametrize(
+    "script, expected",
+    [
+        pytest.param(
+            """from math.operations import plus
+result = plus(5, 3)
+result""",
+            8,
+            id="calls_tool_function",
+        ),
+        pytest.param(
+            """from math.operations import plus, multiply
+result = plus(5, 3)
+result2 = multiply(result, 2)
+result2""",
+            16,
+            id="calls_multiple_tools",
+        ),
+        pytest.param(
+            """from math.statistics import min
 result = min([5, 2, 8, 1, 9])
-result"""
-
+result""",
+            1,
+            id="statistics_min",
+        ),
+        pytest.param(
+            """from math.statistics import average
+result = average([10, 20, 30])
+result""",
+            20.0,
+            id="import_from_nested_module",
+        ),
+    ],
+)
+def test_interpreter_calls_tools(math_tools, script, expected):
+    """Test calling tool functions imported from modules"""
+    interpreter = Interpreter(math_tools)
     result = interpreter.evaluate(script)
-    assert result == 1
+    assert result == expected
 
 
 def test_interpreter_with_if_statement():
@@ -101,6 +116,23 @@ result"""
     assert result == 1
 
 
+@pytest.mark.parametrize(
+    "condition, expected",
+    [("0", 0), ("3", 1), ("[]", 1), ('""', 1), ("1 == 2", 0), ("2 == 2", 1)],
+)
+def test_interpreter_if_condition_truthiness(condition, expected):
+    """Test which condition values select the then-branch"""
+    interpreter = Interpreter([])
+    script = f"""if {condition}:
+    result = 1
+else:
+    result = 0
+result"""
+
+    result = interpreter.evaluate(script)
+    assert result == expected
+
+
 def test_interpreter_with_while_loop():
     """Test while loop evaluation"""
     interpreter = Interpreter([])
@@ -115,22 +147,89 @@ sum"""
     assert result == 10
 
 
-def test_interpreter_import_from_nested_module():
-    """Test importing from nested module paths"""
-    def avg_func(numbers: list[float]) -> float:
-        """Calculate average."""
-        return sum(numbers) / len(numbers)
+def test_interpreter_user_function_recursion():
+    """Test a recursive user-defined function"""
+    interpreter = Interpreter([])
+    script = """def fact(n):
+    if n < 2:
+        result = 1
+    else:
+        result = n * fact(n - 1)
+    return result
+fact(5)"""
 
-    avg_tool = Tool.from_function(avg_func)
-    avg_tool.name = "math_statistics_average"
+    result = interpreter.evaluate(script)
+    assert result == 120
 
-    interpreter = Interpreter([avg_tool])
-    script = """from math.statistics import average
-result = average([10, 20, 30])
-result"""
+
+def test_interpreter_user_function_called_in_loop():
+    """Test calling a user-defined function repeatedly from a while loop"""
+    interpreter = Interpreter([])
+    script = """def double(x):
+    return x * 2
+    x = 100
+i = 0
+total = 0
+while i < 4:
+    total = total + double(i)
+    i = i + 1
+total"""
 
     result = interpreter.evaluate(script)
-    assert result == 20.0
+    assert result == 12
+
+
+def test_interpreter_user_function_does_not_leak_locals():
+    """Test that assignments inside a function are discarded after the call"""
+    interpreter = Interpreter([])
+    script = """x = 1
+def f(y):
+    x = y
+    return x
+f(5)
+x"""
+
+    result = interpreter.evaluate(script)
+    assert result == 1
+
+
+def test_interpreter_failed_user_function_restores_environment():
+    """Test that a function raising an error does not leave its locals behind"""
+    interpreter = Interpreter([])
+    script = """def f(y):
+    z = y
+    return missing(z)
+f(5)"""
+
+    with pytest.raises(RuntimeError, match="Function 'missing' not defined"):
+        interpreter.evaluate(script)
+
+    with pytest.raises(RuntimeError, match="Variable 'z' not defined"):
+        interpreter.evaluate("z")
+
+
+def test_interpreter_reset_clears_script_state():
+    """Test that reset forgets variables and functions but keeps tools"""
+    def add_func(x: float, y: float) -> float:
+        """Add two numbers."""
+        return x + y
+
+    add_tool = Tool.from_function(add_func)
+    add_tool.name = "math_operations_plus"
+
+    interpreter = Interpreter([add_tool])
+    interpreter.evaluate("""from math.operations import plus
+def f(a):
+    return a
+x = plus(1, 2)""")
+    interpreter.reset()
+
+    assert interpreter.last_value is None
+    with pytest.raises(RuntimeError, match="Variable 'x' not defined"):
+        interpreter.evaluate("x")
+    with pytest.raises(RuntimeError, match="Function 'f' not defined"):
+        interpreter.evaluate("f(1)")
+    assert interpreter.evaluate("from math.operations import plus\nplus(2, 3)") == 5
 
 
 def test_interpreter_returns_last_expression():
@@ -247,6 +346,130 @@ result"""
     assert result == "custom: test"
 
 
+def test_tool_from_function_returns_independent_tools():
+    """Test that tools created from the same function can be renamed separately"""
+    def add_func(x: float, y: float) -> float:
+        """Add two numbers."""
+        return x + y
+
+    first = Tool.from_function(add_func)
+    second = Tool.from_function(add_func)
+    first.name = "math_operations_plus"
+
+    assert second.name == "add_func"
+    assert second.parameters is not first.parameters
+    assert [p.name for p in second.parameters] == ["x", "y"]
+
+
+def test_tool_from_mcp_tool_with_type_array_items():
+    """Test that array items typed with a list of types are kept as-is"""
+    mcp_tool = McpTool(
+        name="tags_set",
+        description="Set tags",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tags": {"type": "array", "items": {"type": ["string", "null"]}},
+                "ids": {"type": "array", "items": {"type": "integer"}},
+            },
+        },
+    )
+
+    tool = Tool.from_mcp_tool(mcp_tool, func=None)
+
+    assert [(p.name, p.type) for p in tool.parameters] == [
+        ("tags", "list[['string', 'null']]"),
+        ("ids", "list[integer]"),
+    ]
+
+
+def test_interpreter_reuses_tool_maps_for_same_tools():
+    """Test that interpreters over the same tools share their tool maps"""
+    def add_func(x: float, y: float) -> float:
+        """Add two numbers."""
+        return x + y
+
+    add_tool = Tool.from_function(add_func)
+    add_tool.name = "math_operations_plus"
+
+    first = Interpreter([add_tool])
+    second = Interpreter([add_tool])
+    assert first.tool_map is second.tool_map
+    with pytest.raises(TypeError):
+        first.tool_map["math.operations.minus"] = add_tool
+
+    # Renaming a tool must not reuse the maps built for the old name
+    add_tool.name = "math_operations_add"
+    renamed = Interpreter([add_tool])
+    assert "math.operations.add" in renamed.tool_map
+    assert "math.operations.plus" not in renamed.tool_map
+
+
+def test_interpreter_tool_maps_from_many_threads():
+    """Test that interpreters created concurrently each get their own tools"""
+    def add_func(x: float, y: float) -> float:
+        """Add two numbers."""
+        return x + y
+
+    def build(index):
+        tool = Tool.from_function(add_func)
+        tool.name = f"math_operations_plus{index}"
+        return set(Interpreter([tool]).tool_map)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(build, range(64)))
+
+    assert results == [{f"math.operations.plus{index}"} for index in range(64)]
+
+
+def test_interpreter_import_after_call_rebinds_name():
+    """Test that a name imported later in the script is not bound early"""
+    def builtin_print(text: str) -> str:
+        """Builtin print."""
+        return f"builtin: {text}"
+
+    def custom_print(text: str) -> str:
+        """Custom print."""
+        return f"custom: {text}"
+
+    builtin_tool = Tool.from_function(builtin_print)
+    builtin_tool.name = "builtins_print"
+
+    custom_tool = Tool.from_function(custom_print)
+    custom_tool.name = "io_print"
+
+    interpreter = Interpreter([builtin_tool, custom_tool])
+    script = """before = print("a")
+from io import print
+after = print("b")
+[before, after]"""
+
+    result = interpreter.evaluate(script)
+    assert result == ["builtin: a", "custom: b"]
+
+
+def test_interpreter_import_and_print_script():
+    """Test the common import-then-print script shape"""
+    def add_func(x: float, y: float) -> float:
+        """Add two numbers."""
+        return x + y
+
+    def builtin_print(*args) -> str:
+        """Builtin print."""
+        return " ".join(str(arg) for arg in args)
+
+    add_tool = Tool.from_function(add_func)
+    add_tool.name = "math_operations_plus"
+    print_tool = Tool.from_function(builtin_print)
+    print_tool.name = "builtins_print"
+
+    interpreter = Interpreter([add_tool, print_tool])
+    assert interpreter.evaluate("from math.operations import plus\nprint(plus(2, 3))\n") == "5"
+
+    with pytest.raises(RuntimeError, match="Tool 'math.operations.minus' not found"):
+        interpreter.evaluate("from math.operations import minus\nprint(minus(2, 3))")
+
+
 class TestInterpreterStringSupport:
     """Test interpreter evaluation of strings with single and double quotes"""
 
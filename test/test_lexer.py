@@ -650,3 +650,73 @@ class TestLexerImportAliasSupport:
         assert tokens[3].value == "sub"
         assert tokens[5].value == "subsub"
         assert tokens[7].value == "alias"
+
+
+class TestLexerComments:
+    """Test lexer handling of comments"""
+
+    def test_comment_line_produces_no_tokens(self):
+        """Test that a comment-only line is treated like a blank line"""
+        lexer = Lexer("x = 1\n# a comment\ny")
+        tokens = lexer.tokenize()
+
+        expected_types = [
+            TokenType.IDENTIFIER,
+            TokenType.EQUAL,
+            TokenType.NUMBER,
+            TokenType.NEWLINE,
+            TokenType.NEWLINE,
+            TokenType.IDENTIFIER,
+            TokenType.EOF,
+        ]
+
+        assert [t.type for t in tokens] == expected_types
+        assert tokens[5].line == 3
+
+    def test_trailing_comment(self):
+        """Test that a comment after code is skipped"""
+        lexer = Lexer("print(x)  # Outputs: 5")
+        tokens = lexer.tokenize()
+
+        expected_types = [
+            TokenType.IDENTIFIER,
+            TokenType.LPAREN,
+            TokenType.IDENTIFIER,
+            TokenType.RPAREN,
+            TokenType.EOF,
+        ]
+
+        assert [t.type for t in tokens] == expected_types
+
+    def test_indented_comment_does_not_change_indentation(self):
+        """Test that comments inside a block don't emit INDENT/DEDENT"""
+        source = """if x:
+    y
+  # misaligned comment
+    z"""
+        lexer = Lexer(source)
+        tokens = lexer.tokenize()
+
+        types = [t.type for t in tokens]
+        assert types.count(TokenType.INDENT) == 1
+        assert types.count(TokenType.DEDENT) == 1
+
+    def test_hash_inside_string_is_not_a_comment(self):
+        """Test that '#' inside a string literal is kept"""
+        lexer = Lexer('"a # b"')
+        tokens = lexer.tokenize()
+
+        assert tokens[0].type == TokenType.STRING
+        assert tokens[0].value == "a # b"
+
+
+class TestLexerUnterminatedStrings:
+    """Test lexer errors for unterminated strings"""
+
+    def test_unterminated_string(self):
+        with pytest.raises(SyntaxError, match="Unterminated string"):
+            Lexer('x = "hello').tokenize()
+
+    def test_unterminated_multiline_string(self):
+        with pytest.raises(SyntaxError, match="Unterminated multiline string"):
+            Lexer('x = """hello\nworld').tokenize()
@@ -432,3 +432,40 @@ class TestParserDictSupport:
         assert isinstance(key, String)
         assert isinstance(val, ListLiteral)
         assert len(val.elements) == 3
+
+
+class TestParserStreaming:
+    """Test parser consuming tokens directly from a lexer"""
+
+    def test_parse_from_lexer_iterator(self):
+        """Test that a Lexer can be passed to the parser without tokenize()"""
+        ast = Parser(Lexer("x = 1\nf(x)")).parse()
+
+        assert len(ast) == 2
+        assert isinstance(ast[0], Assignment)
+        assert ast[0].name == "x"
+        assert isinstance(ast[1], ExpressionStatement)
+        assert isinstance(ast[1].expression, Call)
+        assert ast[1].expression.function == "f"
+
+    def test_parse_streamed_matches_token_list(self):
+        """Test that streaming and list-based parsing produce the same AST"""
+        source = "def f(a):\n    return a + 1\nif f(1) == 2:\n    y = [1, 2]\n"
+
+        assert Parser(Lexer(source)).parse() == Parser(Lexer(source).tokenize()).parse()
+
+
+class TestParserNodeKinds:
+    """Test the integer kind tags on AST nodes"""
+
+    def test_nodes_carry_their_kind(self):
+        """Test that parsed nodes expose the kind of their class"""
+        from src.simple_script.parser import NodeKind
+
+        ast = Parser(Lexer("x = 1 + 2\nf(x)")).parse()
+
+        assert ast[0].kind == NodeKind.ASSIGNMENT
+        assert ast[0].value.kind == NodeKind.BINARY_OP
+        assert ast[0].value.left.kind == NodeKind.NUMBER
+        assert ast[1].kind == NodeKind.EXPRESSION_STATEMENT
+        assert ast[1].expression.kind == NodeKind.CALL
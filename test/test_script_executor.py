@@ -168,6 +168,32 @@ class TestParserExpressions:
         assert isinstance(expr.right, BinaryOp)
         assert expr.right.operator == "*"
 
+    def test_parse_left_associativity(self):
+        # 8 - 3 - 2 should parse as (8 - 3) - 2
+        lexer = Lexer("8 - 3 - 2")
+        tokens = lexer.tokenize()
+        parser = Parser(tokens)
+        ast = parser.parse()
+        expr = ast[0].expression
+        assert isinstance(expr, BinaryOp)
+        assert expr.operator == "-"
+        assert isinstance(expr.left, BinaryOp)
+        assert expr.left.operator == "-"
+        assert isinstance(expr.right, Number)
+        assert expr.right.value == 2
+
+    def test_parse_comparison_binds_loosest(self):
+        # 1 + 2 < 3 * 4 should parse as (1 + 2) < (3 * 4)
+        lexer = Lexer("1 + 2 < 3 * 4")
+        tokens = lexer.tokenize()
+        parser = Parser(tokens)
+        ast = parser.parse()
+        expr = ast[0].expression
+        assert isinstance(expr, BinaryOp)
+        assert expr.operator == "<"
+        assert expr.left.operator == "+"
+        assert expr.right.operator == "*"
+
     def test_parse_function_call(self):
         lexer = Lexer("print(42)")
         tokens = lexer.tokenize()
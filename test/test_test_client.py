@@ -0,0 +1,90 @@
+"""Unit tests for the interactive test client's readline history handling."""
+
+import pytest
+
+import test_client
+from test_client import MCPTestClient
+
+
+class StifledReadline:
+    """Minimal stand-in for GNU readline whose history is capped in memory.
+
+    set_history_length caps the history like a stifled GNU history: at
+    capacity the oldest entry is dropped and the history base shifts, so
+    the remaining entries keep their absolute indexes.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.entries: list[str] = []
+        self.base = 1
+
+    def set_history_length(self, length: int) -> None:
+        self.size = length
+
+    def add_history(self, line: str) -> None:
+        self.entries.append(line)
+        if len(self.entries) > self.size:
+            del self.entries[0]
+            self.base += 1
+
+    def clear_history(self) -> None:
+        self.entries = []
+        self.base = 1
+
+    def get_current_history_length(self) -> int:
+        return len(self.entries)
+
+    def get_history_item(self, index: int) -> str | None:
+        position = index - self.base
+        if 0 <= position < len(self.entries):
+            return self.entries[position]
+        return None
+
+
+@pytest.fixture
+def fake_readline(monkeypatch):
+    readline = StifledReadline(size=1000)
+    monkeypatch.setattr(test_client, "readline", readline)
+    monkeypatch.setattr(test_client, "_CAN_BATCH_HISTORY", False)
+    monkeypatch.setattr(MCPTestClient, "MAX_HISTORY_LENGTH", 3)
+    return readline
+
+
+def run_execute(client: MCPTestClient, readline: StifledReadline, commands: list[str]) -> list[str]:
+    """Type commands, then snapshot and restore history as `execute` does."""
+    for command in commands:
+        readline.add_history(command)
+    client._snapshot_history()
+    snapshot = list(client._saved_history)
+    test_client._replace_history(client._saved_history)
+    return snapshot
+
+
+class TestSnapshotHistory:
+    """Test suite for MCPTestClient._snapshot_history."""
+
+    def test_new_commands_are_kept_at_capacity(self, fake_readline):
+        """Test that commands typed while the history is full are not lost."""
+        client = MCPTestClient()
+
+        assert run_execute(client, fake_readline, ["a", "b", "c"]) == ["a", "b", "c"]
+        assert run_execute(client, fake_readline, ["d"]) == ["b", "c", "d"]
+        assert run_execute(client, fake_readline, ["e", "f"]) == ["d", "e", "f"]
+        assert fake_readline.entries == ["d", "e", "f"]
+
+    def test_more_new_commands_than_capacity(self, fake_readline):
+        """Test that only the newest entries are kept when many were typed."""
+        client = MCPTestClient()
+        run_execute(client, fake_readline, ["a"])
+
+        assert run_execute(client, fake_readline, ["b", "c", "d", "e"]) == ["c", "d", "e"]
+
+    def test_unchanged_history_is_reused(self, fake_readline):
+        """Test that the snapshot is kept when no commands were typed."""
+        client = MCPTestClient()
+        run_execute(client, fake_readline, ["a", "b"])
+        snapshot = client._saved_history
+
+        assert run_execute(client, fake_readline, []) == ["a", "b"]
+        assert client._saved_history is snapshot
@@ -1,6 +1,7 @@
 """Unit tests for refactored utils functions."""
 
 import pytest
+from mcp.types import Tool as McpTool
 
 from simple_script.tools import Tool, ToolParameter
 from switchboard_mcp.config import MCPServerConfig, NamespaceMapping, StdioConfig
@@ -10,7 +11,9 @@ from switchboard_mcp.utils import (
     _format_function_description,
     _format_type_from_schema,
     _json_type_to_python,
+    _match_pattern,
     browse_tools,
+    execute_script,
 )
 
 
@@ -54,6 +57,32 @@ class TestFormatFunctionDescription:
         expected = 'def print(text: string) -> Any:\n    """Print text to output"""\n    ...'
         assert result == expected
 
+    def test_renamed_tool_is_formatted_again(self):
+        """Test formatting follows changes made to a tool after a first call."""
+        tool = Tool(name="math_plus", func=None, description="Add")
+        assert _format_function_description(tool).startswith("def plus()")
+        tool.name = "math_minus"
+        assert _format_function_description(tool).startswith("def minus()")
+
+    def test_tool_with_type_array_parameter(self):
+        """Test parameter typed with a list of JSON types, e.g. a nullable string."""
+        tool = Tool.from_mcp_tool(
+            McpTool(
+                name="users_find",
+                description="Find users",
+                inputSchema={
+                    "type": "object",
+                    "properties": {"name": {"type": ["string", "null"]}},
+                },
+            ),
+            func=None,
+        )
+        root = Folder.from_tools([create_tool_group([tool])])
+
+        result = browse_tools(root, "test_server")
+
+        assert "def find(name: ['string', 'null']) -> Any:" in result
+
     def test_builtin_with_underscores(self):
         """Test builtin tool with underscores in name."""
         tool = Tool(
@@ -196,6 +225,46 @@ class TestJsonTypeToPython:
         schema = {}
         assert _json_type_to_python(schema) == "Any"
 
+    def test_nested_array_items(self):
+        """Test array of arrays converts item schemas recursively."""
+        schema = {"type": "array", "items": {"type": "array", "items": {"type": "integer"}}}
+        assert _json_type_to_python(schema) == "list[list[int]]"
+
+    def test_enums_with_equal_hashing_values_stay_distinct(self):
+        """Test that 1, 1.0 and True enum members each keep their own rendering."""
+        assert _json_type_to_python({"enum": [1, 0]}) == "Literal[1, 0]"
+        assert _json_type_to_python({"enum": [True, False]}) == "Literal[True, False]"
+        assert _json_type_to_python({"enum": [1.0, 0.0]}) == "Literal[1.0, 0.0]"
+
+    def test_enum_with_list_member(self):
+        """Test that list enum members are rendered as lists."""
+        assert _json_type_to_python({"enum": [[1], 2]}) == "Literal[[1], 2]"
+
+
+class TestMatchPattern:
+    """Test suite for _match_pattern function."""
+
+    @pytest.mark.parametrize(
+        "tool_name, pattern, expected",
+        [
+            ("browser_click", "browser_click", True),
+            ("browser_click", "browser", False),
+            ("browser_click", "browser_*", True),
+            ("page_click", "browser_*", False),
+            ("browser_click", "*_click", True),
+            ("browser_clicks", "*_click", False),
+            ("browser_click_all", "*click*", True),
+            ("browser_tap", "*click*", False),
+            ("anything", "*", False),
+            ("a_b_c", "a*b*", False),
+            ("a_b_c", "*a*b*", False),
+            ("a_b", "a*b", False),
+        ],
+    )
+    def test_pattern_kinds(self, tool_name, pattern, expected):
+        """Test exact, prefix, suffix, contains and unsupported patterns."""
+        assert _match_pattern(tool_name, pattern) is expected
+
 
 class TestFormatTypeFromSchema:
     """Test suite for _format_type_from_schema function."""
@@ -467,6 +536,15 @@ class TestBrowseToolsWithCounts:
         assert "test_server.browser.console (submodules: 0, functions: 3)" in result
         assert "test_server.browser.fill (submodules: 0, functions: 3)" in result
 
+    def test_hand_built_folders_are_browsable(self):
+        """Test browsing a folder tree constructed directly, without from_tools."""
+        tool = Tool(name="api_users_get", func=None, description="Get user", parameters=None)
+        users = Folder(name="users", folders=[], tools=[tool])
+        root = Folder(name="", folders=[Folder(name="api", folders=[users], tools=[])], tools=[])
+
+        assert "api.users (submodules: 0, functions: 1)" in browse_tools(root, "api")
+        assert "def get() -> Any:" in browse_tools(root, "api.users")
+
 
 class TestBrowseToolsWithTypes:
     """Test suite for browse_tools integration with types."""
@@ -1133,6 +1211,27 @@ class TestNamespaceMappings:
         assert len(first_folder.tools) == 1
         assert first_folder.tools[0].name == "browser_console_log"
 
+    def test_exact_and_wildcard_patterns_keep_mapping_order(self):
+        """Test that exact and wildcard patterns are tried in mapping order."""
+        tools = [
+            Tool(name="browser_click", func=None, description="Click", parameters=None),
+            Tool(name="page_title", func=None, description="Title", parameters=None),
+        ]
+
+        namespace_mappings = [
+            NamespaceMapping(tools=["browser_*"], namespace="first"),
+            NamespaceMapping(tools=["browser_click", "page_title"], namespace="second"),
+            NamespaceMapping(tools=["page_*"], namespace="third"),
+        ]
+
+        tool_group = create_tool_group(tools, namespace_mappings)
+        root = Folder.from_tools([tool_group])
+
+        folders = {f.name: f for f in root.folders[0].folders}
+        assert set(folders) == {"first", "second"}
+        assert [t.name for t in folders["first"].tools] == ["browser_click"]
+        assert [t.name for t in folders["second"].tools] == ["page_title"]
+
     def test_playwright_namespace_structure_from_switchboard_yaml(self):
         """Test comprehensive playwright module structure matching switchboard.yaml config."""
         # Simulate the actual playwright tools (as they come from the MCP server)
@@ -1385,6 +1484,22 @@ class TestNamespaceMappings:
         assert browser_folder.tools[0].name == "mcp__playwright__browser_click"
 
 
+    def test_from_tools_reuses_tree_for_same_tools(self):
+        """Test that the folder tree is cached and rebuilt when mappings change."""
+        tools = [Tool(name="browser_click", func=None, description="Click", parameters=None)]
+        namespace_mappings = [NamespaceMapping(tools=["browser_*"], namespace="browser")]
+        tool_group = create_tool_group(tools, namespace_mappings)
+
+        root = Folder.from_tools([tool_group])
+        assert Folder.from_tools([tool_group]) is root
+
+        # Changing the mapping must not return the cached tree
+        namespace_mappings[0].namespace = "web"
+        remapped = Folder.from_tools([tool_group])
+        assert remapped is not root
+        assert remapped.folders[0].folders[0].name == "web"
+
+
 class TestBrowseToolsWildcard:
     """Test suite for browse_tools wildcard search functionality."""
 
@@ -1567,3 +1682,25 @@ class TestBrowseToolsWildcard:
         assert "def navigate" in result
         # Should NOT show original prefixed names
         assert "mcp__pw__browser_click" not in result
+
+
+class TestExecuteScript:
+    """Test suite for execute_script function."""
+
+    def test_prints_are_collected_per_script(self):
+        """Test each script returns only its own printed output."""
+        import asyncio
+
+        def math_plus(x: int, y: int) -> int:
+            """Add two numbers."""
+            return x + y
+
+        tools = [Tool.from_function(math_plus)]
+
+        async def run_scripts():
+            return await asyncio.gather(
+                execute_script(tools, "import math as m\nprint(m.plus(1, 2))"),
+                execute_script(tools, "print('a')\nprint('b')"),
+            )
+
+        assert asyncio.run(run_scripts()) == ["3", "a\nb"]